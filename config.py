@@ -1,36 +1,97 @@
 """Configuration module for GitHub AutoPilot.
 
 This module centralizes all configuration values and environment variables
-for the continuous improvement automation system.
+for the continuous improvement automation system. The environment is parsed
+exactly once into a frozen Config dataclass; the module-level constants are
+bound from that single instance so existing import sites keep working.
 """
 
 import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
 
-# GitHub API Configuration
-GITHUB_API_URL = "https://api.github.com"
-GITHUB_TOKEN = os.getenv("GH_TOKEN")  # PAT or GitHub Actions token
-
-# Repository Configuration
-REPOSITORY = os.getenv("TARGET_REPOSITORY", "CampbellTrevor/ArbitraryML")  # e.g., "owner/repo"
-BASE_BRANCH = os.getenv("BASE_BRANCH", "Iterate")
-
-# Polling and Timeout Configuration
-PR_POLL_INTERVAL_SECONDS = int(os.getenv("PR_POLL_INTERVAL_SECONDS", "60"))
-MAX_WAIT_FOR_PR_SECONDS = int(os.getenv("MAX_WAIT_FOR_PR_SECONDS", "3600"))  # 1 hour
-PR_READY_TIMEOUT_SECONDS = int(os.getenv("PR_READY_TIMEOUT_SECONDS", "1800"))  # 30 minutes
-PR_CHECK_TIMEOUT_SECONDS = int(os.getenv("PR_CHECK_TIMEOUT_SECONDS", "600"))  # 10 minutes
-
-# Merge Configuration
-AUTO_MERGE_PRS = os.getenv("AUTO_MERGE_PRS", "true").lower() in ("true", "1", "yes")
-MERGE_METHOD = os.getenv("MERGE_METHOD", "squash")  # squash, merge, or rebase
-
-# Loop Control Configuration
-DELAY_BETWEEN_CYCLES_SECONDS = int(os.getenv("DELAY_BETWEEN_CYCLES_SECONDS", "10"))
-MAX_CYCLES = int(os.getenv("MAX_CYCLES", "0"))  # 0 = unlimited
-MAX_CONSECUTIVE_FAILURES = int(os.getenv("MAX_CONSECUTIVE_FAILURES", "3"))
-
-# Validate required configuration
-if not GITHUB_TOKEN and __name__ != "__main__":
-    # Only raise error when actually running, not when importing for testing
-    import warnings
-    warnings.warn("GITHUB_TOKEN environment variable is not set. Set it before running the main loop.")
+
+@dataclass(frozen=True)
+class Config:
+    """Immutable snapshot of all configuration values, parsed once."""
+
+    # GitHub API Configuration
+    github_api_url: str
+    github_token: Optional[str]
+
+    # Repository Configuration
+    repository: str
+    base_branch: str
+
+    # Polling and Timeout Configuration
+    pr_poll_interval_seconds: int
+    max_wait_for_pr_seconds: int
+    pr_ready_timeout_seconds: int
+    pr_check_timeout_seconds: int
+
+    # Merge Configuration
+    auto_merge_prs: bool
+    merge_method: str
+
+    # Loop Control Configuration
+    delay_between_cycles_seconds: int
+    max_cycles: int
+    max_consecutive_failures: int
+
+    # Webhook Configuration (optional event-driven PR waiting)
+    webhook_url: Optional[str]
+    webhook_port: int
+    webhook_secret: Optional[str]
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Parse the environment into a Config exactly once per process."""
+    config = Config(
+        github_api_url="https://api.github.com",
+        github_token=os.getenv("GH_TOKEN"),  # PAT or GitHub Actions token
+        repository=os.getenv("TARGET_REPOSITORY", "CampbellTrevor/ArbitraryML"),  # e.g., "owner/repo"
+        base_branch=os.getenv("BASE_BRANCH", "Iterate"),
+        pr_poll_interval_seconds=int(os.getenv("PR_POLL_INTERVAL_SECONDS", "60")),
+        max_wait_for_pr_seconds=int(os.getenv("MAX_WAIT_FOR_PR_SECONDS", "3600")),  # 1 hour
+        pr_ready_timeout_seconds=int(os.getenv("PR_READY_TIMEOUT_SECONDS", "1800")),  # 30 minutes
+        pr_check_timeout_seconds=int(os.getenv("PR_CHECK_TIMEOUT_SECONDS", "600")),  # 10 minutes
+        auto_merge_prs=os.getenv("AUTO_MERGE_PRS", "true").lower() in ("true", "1", "yes"),
+        merge_method=os.getenv("MERGE_METHOD", "squash"),  # squash, merge, or rebase
+        delay_between_cycles_seconds=int(os.getenv("DELAY_BETWEEN_CYCLES_SECONDS", "10")),
+        max_cycles=int(os.getenv("MAX_CYCLES", "0")),  # 0 = unlimited
+        max_consecutive_failures=int(os.getenv("MAX_CONSECUTIVE_FAILURES", "3")),
+        webhook_url=os.getenv("WEBHOOK_URL"),  # public URL registered as a repo webhook
+        webhook_port=int(os.getenv("WEBHOOK_PORT", "8040")),
+        webhook_secret=os.getenv("WEBHOOK_SECRET"),  # shared secret for X-Hub-Signature-256
+    )
+
+    # Validate required configuration
+    if not config.github_token:
+        import warnings
+        warnings.warn("GITHUB_TOKEN environment variable is not set. Set it before running the main loop.")
+
+    return config
+
+
+# Module-level constants bound from the single parsed Config, so existing
+# `from config import REPOSITORY` import sites keep working unchanged.
+_config = get_config()
+
+GITHUB_API_URL = _config.github_api_url
+GITHUB_TOKEN = _config.github_token
+REPOSITORY = _config.repository
+BASE_BRANCH = _config.base_branch
+PR_POLL_INTERVAL_SECONDS = _config.pr_poll_interval_seconds
+MAX_WAIT_FOR_PR_SECONDS = _config.max_wait_for_pr_seconds
+PR_READY_TIMEOUT_SECONDS = _config.pr_ready_timeout_seconds
+PR_CHECK_TIMEOUT_SECONDS = _config.pr_check_timeout_seconds
+AUTO_MERGE_PRS = _config.auto_merge_prs
+MERGE_METHOD = _config.merge_method
+DELAY_BETWEEN_CYCLES_SECONDS = _config.delay_between_cycles_seconds
+MAX_CYCLES = _config.max_cycles
+MAX_CONSECUTIVE_FAILURES = _config.max_consecutive_failures
+WEBHOOK_URL = _config.webhook_url
+WEBHOOK_PORT = _config.webhook_port
+WEBHOOK_SECRET = _config.webhook_secret
@@ -3,85 +3,146 @@
 This module handles triggering the GitHub Copilot coding agent via gh CLI.
 """
 
+import functools
+import logging
 import os
 import re
+import shutil
 import subprocess
-from typing import Optional
+import threading
+import time
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Disk cache of the resolved gh path, so restarts skip the discovery probe
+_GH_PATH_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "github-autopilot", "gh_path")
+
+# How long a successful `gh auth status` probe stays valid
+AUTH_CHECK_TTL_SECONDS = 300
+
+# Precompiled patterns for parsing gh agent-task output
+_QUEUED_RE = re.compile(r"job.*queued|queued.*job", re.IGNORECASE | re.DOTALL)
+_PR_URL_RE = re.compile(r"pull/(\d+)")
+_PR_HASH_RE = re.compile(r"#(\d+)")
+
+# Timestamp and result of the last `gh auth status` probe
+_auth_check_cache: Optional[Tuple[float, bool]] = None
+
+
+def _remember_gh_path(path: str) -> None:
+    """Persist the resolved gh path; failures only cost the disk cache."""
+    try:
+        os.makedirs(os.path.dirname(_GH_PATH_CACHE), exist_ok=True)
+        with open(_GH_PATH_CACHE, "w", encoding="utf-8") as f:
+            f.write(path)
+    except OSError:
+        pass
+
 
 # Find and use gh CLI executable
+@functools.lru_cache(maxsize=1)
 def find_gh_executable() -> Optional[str]:
-    """Find gh.exe, checking PATH and common install locations."""
-    # Try PATH first
+    """Find gh.exe, checking the disk cache, PATH, and common install locations."""
+    # A previous run already resolved the binary; trust it if still present
+    try:
+        with open(_GH_PATH_CACHE, "r", encoding="utf-8") as f:
+            cached = f.read().strip()
+        if cached and (os.path.isfile(cached) or shutil.which(cached)):
+            return cached
+    except OSError:
+        pass
+
+    # Try PATH next. Only the return code matters, so discard the output
+    # instead of capturing and decoding it.
     try:
         result = subprocess.run(
             ["gh", "--version"],
-            capture_output=True,
-            text=True,
-            timeout=10
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=5
         )
         if result.returncode == 0:
+            _remember_gh_path("gh")
             return "gh"
     except (FileNotFoundError, subprocess.SubprocessError):
         pass
-    
+
     # Try common install locations on Windows
     common_paths = [
         r"C:\Program Files\GitHub CLI\gh.exe",
         r"C:\Program Files (x86)\GitHub CLI\gh.exe",
         os.path.expandvars(r"%LOCALAPPDATA%\Programs\GitHub CLI\gh.exe"),
     ]
-    
+
     for path in common_paths:
         if os.path.exists(path):
+            _remember_gh_path(path)
             return path
-    
+
     return None
 
 
-def trigger_copilot_via_gh_cli(repository: str, base_branch: str, prompt: str) -> Optional[int]:
-    """Trigger Copilot coding agent via gh CLI.
-    
-    Returns the PR number if successful, None otherwise.
+def _has_stored_credentials(gh_cmd: str) -> bool:
+    """Check that gh CLI is authenticated with stored credentials.
+
+    Spawning `gh auth status` costs ~100ms per call and the answer rarely
+    changes, so a passing result is cached for AUTH_CHECK_TTL_SECONDS.
     """
-    print(f"Triggering Copilot via gh CLI for branch {base_branch}...")
-    
-    # Find gh executable
-    gh_cmd = find_gh_executable()
-    if not gh_cmd:
-        print("ERROR: gh CLI not found. Please install GitHub CLI: https://cli.github.com/")
-        print("After installing, restart VS Code completely.")
-        return None
-    
-    print(f"Using gh CLI: {gh_cmd}")
-    
-    # Check if gh is authenticated with stored credentials (not just env var)
-    print("Checking gh CLI authentication...")
+    global _auth_check_cache
+
+    now = time.monotonic()
+    if _auth_check_cache and (now - _auth_check_cache[0]) < AUTH_CHECK_TTL_SECONDS:
+        return _auth_check_cache[1]
+
     auth_check_result = subprocess.run(
         [gh_cmd, "auth", "status"],
         capture_output=True,
         text=True,
         timeout=10
     )
-    
+
     if auth_check_result.returncode != 0:
-        print("✗ gh CLI is not authenticated")
-        print("\nPlease authenticate gh CLI by running:")
-        print("  gh auth login")
-        print("\nThen re-run this script.")
-        return None
-    
+        logger.error("✗ gh CLI is not authenticated")
+        logger.error("Please authenticate gh CLI by running 'gh auth login', then re-run this script.")
+        return False
+
     # Check if using environment variable (which won't work for agent-task)
     auth_output = auth_check_result.stdout + auth_check_result.stderr
     if "GITHUB_TOKEN" in auth_output or "environment variable" in auth_output.lower():
-        print("✗ gh CLI is authenticated via environment variable")
-        print("  agent-task command requires stored credentials, not environment variables")
-        print("\nPlease authenticate gh CLI with stored credentials:")
-        print("  gh auth login")
-        print("\nThen re-run this script.")
-        return None
-    
-    print("✓ gh CLI is authenticated with stored credentials")
+        logger.error("✗ gh CLI is authenticated via environment variable")
+        logger.error("agent-task command requires stored credentials, not environment variables")
+        logger.error("Please authenticate gh CLI with stored credentials ('gh auth login'), then re-run this script.")
+        return False
+
+    # Only cache the passing result so a fixed login is picked up immediately
+    _auth_check_cache = (now, True)
+    return True
+
+
+def trigger_copilot_via_gh_cli(repository: str, base_branch: str, prompt: str) -> Optional[int]:
+    """Trigger Copilot coding agent via gh CLI.
     
+    Returns the PR number if successful, None otherwise.
+    """
+    logger.info("Triggering Copilot via gh CLI for branch %s...", base_branch)
+
+    # Find gh executable
+    gh_cmd = find_gh_executable()
+    if not gh_cmd:
+        logger.error("gh CLI not found. Please install GitHub CLI: https://cli.github.com/")
+        logger.error("After installing, restart VS Code completely.")
+        return None
+
+    logger.info("Using gh CLI: %s", gh_cmd)
+
+    # Check if gh is authenticated with stored credentials (not just env var)
+    logger.info("Checking gh CLI authentication...")
+    if not _has_stored_credentials(gh_cmd):
+        return None
+
+    logger.info("✓ gh CLI is authenticated with stored credentials")
+
     # Set environment for gh CLI
     # Use clean environment without GITHUB_TOKEN/GH_TOKEN to let gh use stored credentials
     env = os.environ.copy()
@@ -100,57 +161,92 @@ def trigger_copilot_via_gh_cli(repository: str, base_branch: str, prompt: str) -
     ]
     
     try:
-        print(f"Running: gh agent-task create --repo {repository} --base {base_branch} <prompt>")
-        result = subprocess.run(
+        logger.info("Running: gh agent-task create --repo %s --base %s <prompt>", repository, base_branch)
+        # Stream stdout line by line so we can return the moment gh prints
+        # the PR URL or queue confirmation, instead of buffering the whole
+        # run and waiting out the rest of the 5-minute window.
+        proc = subprocess.Popen(
             cmd,
             env=env,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=300,  # 5 minute timeout
-            check=False
+            bufsize=1,
         )
-        
-        if result.returncode != 0:
-            error_msg = result.stderr
-            print(f"gh CLI error: {error_msg}")
-            return None
-        
-        # Parse output - gh agent-task returns a job ID, not a PR number immediately
-        output = result.stdout
-        print(f"gh CLI output: {output}")
-        
-        # Check if job was queued successfully
-        if "job" in output.lower() and "queued" in output.lower():
-            print("✓ Copilot job queued successfully")
-            print("Waiting for Copilot to create PR...")
-            
+
+        deadline = time.monotonic() + 300  # 5 minute timeout
+        # Backstop: readline blocks if gh goes quiet, so kill at the deadline
+        watchdog = threading.Timer(300, proc.kill)
+        watchdog.daemon = True
+        watchdog.start()
+
+        pr_number: Optional[int] = None
+        queued = False
+        output_lines = []
+        try:
+            for line in proc.stdout:
+                output_lines.append(line)
+                pr_match = _PR_URL_RE.search(line)
+                if pr_match:
+                    pr_number = int(pr_match.group(1))
+                    break
+                if _QUEUED_RE.search(line):
+                    queued = True
+                    break
+                if time.monotonic() >= deadline:
+                    break
+        finally:
+            watchdog.cancel()
+
+        if pr_number is not None or queued:
+            # We have what we need; don't wait for the rest of the run
+            if proc.poll() is None:
+                proc.terminate()
+            proc.stdout.close()
+            if pr_number is not None:
+                logger.info("✓ Copilot triggered, PR #%d", pr_number)
+                return pr_number
+            logger.info("✓ Copilot job queued successfully")
+            logger.info("Waiting for Copilot to create PR...")
             # The PR will be created shortly, we need to poll for it
             # Return a sentinel value to indicate we need to poll
             return -1
-        
-        # Look for PR URL or number in output (in case format changes)
-        pr_match = re.search(r'pull/(\d+)', output)
-        if pr_match:
-            pr_number = int(pr_match.group(1))
-            print(f"✓ Copilot triggered, PR #{pr_number}")
-            return pr_number
-        
+
+        if proc.poll() is None:
+            proc.kill()
+            proc.communicate()
+            logger.error("gh CLI command timed out")
+            return None
+
+        proc.wait()
+        output = "".join(output_lines)
+
+        if proc.returncode != 0:
+            logger.error("gh CLI error: %s", output)
+            return None
+
+        # Parse output - gh agent-task returns a job ID, not a PR number immediately
+        logger.info("gh CLI output: %s", output)
+
+        # The queue confirmation may span lines, so re-check the full output
+        if _QUEUED_RE.search(output):
+            logger.info("✓ Copilot job queued successfully")
+            logger.info("Waiting for Copilot to create PR...")
+            return -1
+
         # Alternative: look for just the PR number
-        pr_match = re.search(r'#(\d+)', output)
+        pr_match = _PR_HASH_RE.search(output)
         if pr_match:
             pr_number = int(pr_match.group(1))
-            print(f"✓ Copilot triggered, PR #{pr_number}")
+            logger.info("✓ Copilot triggered, PR #%d", pr_number)
             return pr_number
-        
-        print("⚠️  Unexpected output format from gh CLI")
-        return None
-        
-    except subprocess.TimeoutExpired:
-        print("gh CLI command timed out")
+
+        logger.warning("⚠️  Unexpected output format from gh CLI")
         return None
+
     except FileNotFoundError:
-        print("ERROR: gh CLI not found. Please install GitHub CLI: https://cli.github.com/")
+        logger.error("gh CLI not found. Please install GitHub CLI: https://cli.github.com/")
         return None
     except Exception as e:
-        print(f"Error running gh CLI: {e}")
+        logger.error("Error running gh CLI: %s", e)
         return None
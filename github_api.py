@@ -4,22 +4,46 @@ This module provides functions for interacting with GitHub's REST and GraphQL AP
 including rate limiting, retries, and common API operations.
 """
 
-import base64
+import json
+import os
+import re
 import time
 import logging
+import threading
 import requests
+from urllib3.util.retry import Retry
+from collections import namedtuple
+from functools import lru_cache, wraps
 from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from config import GITHUB_API_URL, GITHUB_TOKEN
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator; stdlib json is the fallback
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+def _json(response: requests.Response) -> Any:
+    """Parse a response body, using orjson when available (2-3x faster)."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 # Constants for repository tree fetching
 MAX_TREE_ITEMS = 100
 MAX_TREE_DEPTH = 2
 
-# Initialize HTTP session with authentication
+# Paths excluded from tree listings; one compiled alternation scans in C
+# instead of several Python-level substring checks per entry
+_EXCLUDE_RE = re.compile(r"\.git/|node_modules/|__pycache__/|\.pyc|dist/|build/")
+
+# Initialize HTTP session with authentication. This single session is shared
+# by every module (pr_manager, issue_manager, ...) so all API calls reuse one
+# warm TLS connection pool instead of reopening connections per request.
 session = requests.Session()
 session.headers.update(
     {
@@ -28,40 +52,196 @@ session.headers.update(
         "X-GitHub-Api-Version": "2022-11-28",
     }
 )
+# Retries happen inside urllib3 on the warm connection and honor GitHub's
+# Retry-After header during secondary rate limiting
+_retry = Retry(
+    total=5,
+    backoff_factor=1.0,
+    status_forcelist=[429, 500, 502, 503, 504],
+    respect_retry_after_header=True,
+    allowed_methods=frozenset(["GET", "POST", "PATCH", "PUT"]),
+)
+session.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(
+        pool_connections=20, pool_maxsize=50, pool_block=False, max_retries=_retry
+    ),
+)
+
+# Rate-limit state piggy-backed on X-RateLimit-* response headers, so
+# check_rate_limit rarely needs its own round-trip to /rate_limit.
+_rl_remaining: Optional[int] = None
+_rl_reset: Optional[int] = None
+_last_rl_check_mono: float = 0.0
+
+# Fast-path guard: skip re-evaluating the rate limit when it was checked
+# recently and plenty of quota remained
+RATE_LIMIT_RECHECK_SECONDS = 30
+RATE_LIMIT_FAST_PATH_REMAINING = 1000
+
+# Waiting on an Event instead of time.sleep lets another thread (e.g. a
+# shutdown handler) wake a rate-limited wait early by setting the event.
+_rate_limit_wakeup = threading.Event()
 
-# Cache for Copilot bot ID
-_copilot_bot_id: Optional[str] = None
 
+def wake_rate_limit_wait() -> None:
+    """Wake any thread parked in a rate-limit wait.
 
-def retry_on_failure(func, max_retries: int = 3, delay: int = 5):
-    """Retry a function on failure with exponential backoff."""
-    for attempt in range(max_retries):
+    Called from the shutdown path; the event stays set afterwards so later
+    waits return immediately instead of stalling the exit.
+    """
+    _rate_limit_wakeup.set()
+
+
+def _update_rate_limit_from_headers(headers: Any) -> None:
+    """Record rate-limit state from a response's X-RateLimit-* headers."""
+    global _rl_remaining, _rl_reset
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    if remaining is not None and reset is not None:
         try:
-            return func()
-        except requests.RequestException as e:
-            if attempt == max_retries - 1:
-                raise
-            wait_time = delay * (2 ** attempt)
-            logger.warning(f"Request failed (attempt {attempt + 1}/{max_retries}): {e}. Retrying in {wait_time}s...")
-            time.sleep(wait_time)
+            _rl_remaining = int(remaining)
+            _rl_reset = int(reset)
+        except (TypeError, ValueError):
+            pass
+
+
+def _rate_limit_hook(response: requests.Response, *args: Any, **kwargs: Any) -> None:
+    """Session response hook: harvest rate-limit headers from every call."""
+    _update_rate_limit_from_headers(response.headers)
+
+
+# Every request through the shared session (GETs, GraphQL POSTs, PR
+# writes) keeps the rate-limit state fresh for free
+session.hooks["response"].append(_rate_limit_hook)
+
+
+# Cache of parsed GET responses keyed by (url, params). GitHub returns an
+# ETag with every response; replaying it via If-None-Match yields a
+# 304 Not Modified that does not count against the rate limit.
+_response_cache: Dict[Tuple[str, Tuple], Tuple[str, Any]] = {}
+
+
+def cached_get(url: str, params: Optional[Dict[str, Any]] = None, timeout: int = 30,
+               accept: Optional[str] = None) -> Any:
+    """GET a GitHub API URL with ETag-based conditional-request caching.
+
+    Sends If-None-Match when a cached ETag exists and serves the parsed
+    body from cache on a 304 Not Modified, so repeated polling of
+    unchanged resources is nearly free.
+
+    Args:
+        url: Full API URL to fetch
+        params: Optional query parameters
+        timeout: Request timeout in seconds
+        accept: Optional Accept header override; raw media types return
+            the body as text instead of parsed JSON
+
+    Returns:
+        Parsed JSON response body, or the raw text when a raw media type
+        was requested
+    """
+    raw = accept is not None and "raw" in accept
+    key = (url, tuple(sorted(params.items())) if params else (), accept)
+    cached = _response_cache.get(key)
+
+    headers = {}
+    if accept:
+        headers["Accept"] = accept
+    if cached:
+        headers["If-None-Match"] = cached[0]
+
+    response = session.get(url, params=params, headers=headers, timeout=timeout)
+
+    if response.status_code == 304 and cached:
+        return cached[1]
+
+    response.raise_for_status()
+    data = response.text if raw else _json(response)
+
+    etag = response.headers.get("ETag")
+    if etag:
+        _response_cache[key] = (etag, data)
+
+    return data
+
+
+def ttl_cache(seconds: float):
+    """Memoize a function by its positional arguments for a short TTL.
+
+    A conditional GET still costs a round-trip; this skips the network
+    entirely for the duplicate lookups that happen within one cycle. The
+    decorated function gains an ``invalidate(*args)`` attribute - call it
+    with the original arguments to drop one entry, or with none to clear
+    everything - so mutating actions can keep the cache honest.
+    """
+    def decorator(fn):
+        cache: Dict[Tuple, Tuple[float, Any]] = {}
+        lock = threading.Lock()
+
+        @wraps(fn)
+        def wrapper(*args):
+            now = time.monotonic()
+            with lock:
+                entry = cache.get(args)
+                if entry and now < entry[0]:
+                    return entry[1]
+            value = fn(*args)
+            with lock:
+                cache[args] = (now + seconds, value)
+            return value
+
+        def invalidate(*args):
+            with lock:
+                if args:
+                    cache.pop(args, None)
+                else:
+                    cache.clear()
+
+        wrapper.invalidate = invalidate
+        return wrapper
+    return decorator
 
 
 def check_rate_limit() -> None:
-    """Check GitHub API rate limit and wait if necessary."""
+    """Check GitHub API rate limit and wait if necessary.
+
+    Uses the X-RateLimit-* headers recorded from previous responses when
+    available; the explicit GET to /rate_limit only happens before any
+    other call has populated the cached state. A recent check with ample
+    quota remaining returns immediately.
+    """
+    global _rl_remaining, _rl_reset, _last_rl_check_mono
+
+    # Fast path: checked recently with plenty of quota left
+    if (
+        _rl_remaining is not None
+        and _rl_remaining > RATE_LIMIT_FAST_PATH_REMAINING
+        and time.monotonic() - _last_rl_check_mono < RATE_LIMIT_RECHECK_SECONDS
+    ):
+        return
+
     try:
-        response = session.get(f"{GITHUB_API_URL}/rate_limit", timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        core_remaining = data.get("resources", {}).get("core", {}).get("remaining", 0)
-        core_reset = data.get("resources", {}).get("core", {}).get("reset", 0)
-        
-        if core_remaining < 100:  # Low on rate limit
-            reset_time = datetime.fromtimestamp(core_reset)
+        if _rl_remaining is None:
+            response = session.get(f"{GITHUB_API_URL}/rate_limit", timeout=10)
+            response.raise_for_status()
+            data = _json(response)
+
+            core = data.get("resources", {}).get("core", {})
+            _rl_remaining = core.get("remaining", 0)
+            _rl_reset = core.get("reset", 0)
+
+        if _rl_remaining < 100:  # Low on rate limit
+            reset_time = datetime.fromtimestamp(_rl_reset or 0)
             wait_seconds = (reset_time - datetime.now()).total_seconds()
             if wait_seconds > 0:
-                logger.warning(f"Rate limit low ({core_remaining} remaining). Waiting {int(wait_seconds)}s until reset...")
-                time.sleep(min(wait_seconds + 10, 3600))  # Wait but cap at 1 hour
+                logger.warning(f"Rate limit low ({_rl_remaining} remaining). Waiting {int(wait_seconds)}s until reset...")
+                # Single-shot interruptible wait until just past the reset,
+                # capped at 1 hour
+                _rate_limit_wakeup.wait(min(wait_seconds + 10, 3600))
+                _rl_remaining = None  # Force a re-probe after the reset
+
+        _last_rl_check_mono = time.monotonic()
     except Exception as e:
         logger.warning(f"Could not check rate limit: {e}")
 
@@ -74,87 +254,267 @@ def graphql_query(query: str, variables: Optional[Dict[str, Any]] = None) -> Dic
     payload = {"query": query}
     if variables:
         payload["variables"] = variables
-    
-    response = session.post(url, json=payload, timeout=60)
+
+    if orjson is not None:
+        # Skip the stdlib json encoder on the request side as well
+        response = session.post(
+            url,
+            data=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=60,
+        )
+    else:
+        response = session.post(url, json=payload, timeout=60)
     response.raise_for_status()
-    return response.json()
+    return _json(response)
 
 
-def split_owner_repo(repo: str) -> Tuple[str, str]:
+# Named tuple so callers can unpack positionally (owner, repo) or read
+# attributes; lru_cache means each repository string is parsed once
+OwnerRepo = namedtuple("OwnerRepo", "owner repo")
+
+
+@lru_cache(maxsize=16)
+def split_owner_repo(repo: str) -> OwnerRepo:
     """Split a repository string into owner and name components."""
     if "/" not in repo:
         raise ValueError(f"Invalid repository: {repo}. Expected 'owner/repo'.")
     owner, name = repo.split("/", 1)
-    return owner, name
+    return OwnerRepo(owner, name)
 
 
-def get_copilot_bot_id(repository: str) -> str:
-    """Get the Copilot bot ID for assigning issues."""
-    global _copilot_bot_id
-    
-    if _copilot_bot_id:
-        return _copilot_bot_id
-    
+@lru_cache(maxsize=16)
+def repo_base_url(repository: str) -> str:
+    """Return the cached REST base URL for a repository's /repos/ routes."""
     owner, repo = split_owner_repo(repository)
-    
-    query = """
-    query($owner: String!, $repo: String!) {
-      repository(owner: $owner, name: $repo) {
-        suggestedActors(capabilities: [CAN_BE_ASSIGNED], first: 100) {
-          nodes {
-            login
-            __typename
-            ... on Bot {
-              id
+    return f"{GITHUB_API_URL}/repos/{owner}/{repo}"
+
+
+# GraphQL documents live at module scope so each call reuses one shared
+# string object instead of rebuilding it per invocation
+_BOOTSTRAP_QUERY = """
+query($owner: String!, $repo: String!) {
+  repository(owner: $owner, name: $repo) {
+    id
+    suggestedActors(capabilities: [CAN_BE_ASSIGNED], first: 25) {
+      nodes {
+        login
+        ... on Bot {
+          id
+        }
+      }
+    }
+  }
+}
+"""
+
+_REPO_OVERVIEW_QUERY = """
+query($owner: String!, $repo: String!, $expr: String!, $ref: String!, $limit: Int!) {
+  repository(owner: $owner, name: $repo) {
+    object(expression: $expr) {
+      ... on Tree {
+        entries {
+          name
+          type
+          object {
+            ... on Tree {
+              entries {
+                name
+                type
+              }
             }
-            ... on User {
-              id
+          }
+        }
+      }
+    }
+    ref(qualifiedName: $ref) {
+      target {
+        ... on Commit {
+          history(first: $limit) {
+            nodes {
+              oid
+              messageHeadline
             }
           }
         }
       }
     }
+  }
+}
+"""
+
+# On-disk cache for identity-shaped data, so restarts skip the bootstrap
+# query entirely. IDs are immutable; the TTL guards against rare rotations.
+_ID_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "github-autopilot", "ids.json")
+_ID_CACHE_VERSION = 1
+ID_CACHE_TTL_SECONDS = 30 * 24 * 3600  # 30 days
+
+
+def _load_id_cache() -> Dict[str, Any]:
+    """Read the per-repository ID cache from disk (empty dict on any miss)."""
+    try:
+        with open(_ID_CACHE_PATH, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if cache.get("version") != _ID_CACHE_VERSION:
+        return {}
+    return cache.get("repositories", {})
+
+
+def _save_id_cache(repository: str, repo_id: Optional[str], bot_id: Optional[str]) -> None:
+    """Persist a repository's IDs to disk; failures only cost the cache."""
+    repositories = _load_id_cache()
+    repositories[repository] = {"repo_id": repo_id, "bot_id": bot_id, "saved_at": time.time()}
+
+    try:
+        os.makedirs(os.path.dirname(_ID_CACHE_PATH), exist_ok=True)
+        with open(_ID_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump({"version": _ID_CACHE_VERSION, "repositories": repositories}, f)
+    except OSError as e:
+        logger.debug(f"Could not persist ID cache: {e}")
+
+
+# Manual memo instead of lru_cache so a not-found bot is never frozen:
+# only complete results are stored, and a long-running loop re-queries
+# until a newly enabled agent shows up
+_bootstrap_cache: Dict[str, Tuple[str, str]] = {}
+_bootstrap_lock = threading.Lock()
+
+
+def _bootstrap_repo(repository: str) -> Tuple[Optional[str], Optional[str]]:
+    """Fetch the repository ID and Copilot bot ID in one GraphQL query.
+
+    Both IDs are needed together at startup; fusing the two lookups into
+    one POST halves the bootstrap round-trips. Complete results are
+    memoized per repository since both IDs are immutable; a lookup that
+    found no bot is not cached, so the next call re-queries.
+
+    Returns:
+        Tuple of (repository ID, Copilot bot ID); either may be None if
+        not found
     """
-    
+    with _bootstrap_lock:
+        cached = _bootstrap_cache.get(repository)
+    if cached:
+        return cached
+    # Fresh disk-cache entries skip the network entirely across restarts.
+    # An entry without a bot ID is treated as a miss: the agent may have
+    # been enabled since, and serving the miss would pin the failure.
+    entry = _load_id_cache().get(repository)
+    if (entry and entry.get("bot_id")
+            and time.time() - entry.get("saved_at", 0) < ID_CACHE_TTL_SECONDS):
+        ids = (entry.get("repo_id"), entry.get("bot_id"))
+        with _bootstrap_lock:
+            _bootstrap_cache[repository] = ids
+        return ids
+
+    owner, repo = split_owner_repo(repository)
     variables = {"owner": owner, "repo": repo}
-    result = graphql_query(query, variables)
-    
+    result = graphql_query(_BOOTSTRAP_QUERY, variables)
+
+    repo_data = result.get("data", {}).get("repository") or {}
+    repo_id = repo_data.get("id")
+
     # Find copilot-swe-agent in the suggested actors
-    actors = result.get("data", {}).get("repository", {}).get("suggestedActors", {}).get("nodes", [])
-    
-    for actor in actors:
+    bot_id = None
+    for actor in repo_data.get("suggestedActors", {}).get("nodes", []):
         if actor.get("login") == "copilot-swe-agent":
-            _copilot_bot_id = actor.get("id")
-            return _copilot_bot_id
-    
-    raise RuntimeError(
-        f"Copilot coding agent not found in repository {repository}. "
-        "Please ensure Copilot coding agent is enabled for this repository."
-    )
+            bot_id = actor.get("id")
+            break
+
+    # Only persist complete results; caching a not-yet-enabled agent would
+    # keep get_copilot_bot_id failing for 30 days after the user fixes it
+    if repo_id and bot_id:
+        with _bootstrap_lock:
+            _bootstrap_cache[repository] = (repo_id, bot_id)
+        _save_id_cache(repository, repo_id, bot_id)
+
+    return repo_id, bot_id
+
+
+def get_copilot_bot_id(repository: str) -> str:
+    """Get the Copilot bot ID for assigning issues."""
+    bot_id = _bootstrap_repo(repository)[1]
+    if not bot_id:
+        raise RuntimeError(
+            f"Copilot coding agent not found in repository {repository}. "
+            "Please ensure Copilot coding agent is enabled for this repository."
+        )
+    return bot_id
 
 
 def get_repository_id(repository: str) -> str:
     """Get the GraphQL global ID for a repository."""
-    owner, repo = split_owner_repo(repository)
-    
-    query = """
-    query($owner: String!, $repo: String!) {
-      repository(owner: $owner, name: $repo) {
-        id
-      }
-    }
-    """
-    
-    variables = {"owner": owner, "repo": repo}
-    result = graphql_query(query, variables)
-    
-    repo_id = result.get("data", {}).get("repository", {}).get("id")
+    repo_id = _bootstrap_repo(repository)[0]
     if not repo_id:
         raise RuntimeError(f"Could not fetch repository ID for {repository}")
-    
     return repo_id
 
 
+def get_repository_overview(repository: str, branch: str = "main", limit: int = 10) -> Tuple[str, str]:
+    """Get repository file tree and recent commits in a single GraphQL query.
+
+    Fuses what get_repository_tree and get_repository_commits fetch with two
+    REST round-trips into one POST, halving latency and rate-limit cost.
+
+    Args:
+        repository: Repository in 'owner/repo' format
+        branch: Branch name to read tree and commits from
+        limit: Number of recent commits to fetch
+
+    Returns:
+        Tuple of (structure string, commits string), formatted identically
+        to the REST-based helpers
+    """
+    owner, repo = split_owner_repo(repository)
+    variables = {"owner": owner, "repo": repo, "expr": f"{branch}:", "ref": branch, "limit": limit}
+
+    try:
+        result = graphql_query(_REPO_OVERVIEW_QUERY, variables)
+        repo_data = result.get("data", {}).get("repository") or {}
+    except Exception as e:
+        return (
+            f"Error fetching repository structure: {e}",
+            f"Error fetching commit history: {e}",
+        )
+
+    # Format the tree the same way get_repository_tree does
+    excluded_names = {".git", "node_modules", "__pycache__", "dist", "build"}
+    files = []
+    for entry in (repo_data.get("object") or {}).get("entries") or []:
+        name = entry.get("name", "")
+        if name in excluded_names or name.endswith(".pyc"):
+            continue
+        if entry.get("type") == "tree":
+            files.append(f"{name}/")
+            for child in (entry.get("object") or {}).get("entries") or []:
+                child_name = child.get("name", "")
+                if child_name in excluded_names or child_name.endswith(".pyc"):
+                    continue
+                suffix = "/" if child.get("type") == "tree" else ""
+                files.append(f"  {child_name}{suffix}")
+        else:
+            files.append(name)
+        if len(files) >= MAX_TREE_ITEMS:
+            break
+
+    if files:
+        structure = "Repository structure:\n" + "\n".join(files[:MAX_TREE_ITEMS])
+    else:
+        structure = "Repository structure not available"
+
+    # Format commits the same way get_repository_commits does
+    history = (((repo_data.get("ref") or {}).get("target") or {}).get("history") or {}).get("nodes") or []
+    if history:
+        commits = "\n".join(f"{c.get('oid', '')[:7]} {c.get('messageHeadline', '')}" for c in history)
+    else:
+        commits = "No commits found"
+
+    return structure, commits
+
+
 def get_repository_tree(repository: str, branch: str = "main") -> str:
     """Get repository file tree via GitHub API.
     
@@ -165,40 +525,41 @@ def get_repository_tree(repository: str, branch: str = "main") -> str:
     Returns:
         String representation of repository structure
     """
-    owner, repo = split_owner_repo(repository)
-    
     try:
         # Get the tree via REST API
-        url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/git/trees/{branch}?recursive=1"
-        response = session.get(url, timeout=30)
-        response.raise_for_status()
-        data = response.json()
-        
+        url = f"{repo_base_url(repository)}/git/trees/{branch}"
+        data = cached_get(url, params={"recursive": 1}, timeout=30)
+
         tree = data.get("tree", [])
         if not tree:
             return "Unable to fetch repository structure"
         
         # Build a simple tree representation
-        # Filter out common excludes and limit depth
+        # Filter out common excludes and limit depth, stopping as soon as
+        # the output quota is filled so huge trees cost O(MAX_TREE_ITEMS)
         files = []
-        for item in tree[:MAX_TREE_ITEMS]:  # Limit to avoid overwhelming output
+        for item in tree:
+            if len(files) >= MAX_TREE_ITEMS:  # Limit to avoid overwhelming output
+                break
+
             path = item.get("path", "")
             item_type = item.get("type", "")
-            
+
             # Skip common excludes
-            if any(exclude in path for exclude in [".git/", "node_modules/", "__pycache__/", ".pyc", "dist/", "build/"]):
+            if _EXCLUDE_RE.search(path):
                 continue
-            
+
             # Count depth
             depth = path.count("/")
             if depth > MAX_TREE_DEPTH:  # Limit to avoid overwhelming output
                 continue
-            
+
             indent = "  " * depth
+            basename = path.rsplit("/", 1)[-1]
             if item_type == "tree":
-                files.append(f"{indent}{path.split('/')[-1]}/")
+                files.append(f"{indent}{basename}/")
             else:
-                files.append(f"{indent}{path.split('/')[-1]}")
+                files.append(f"{indent}{basename}")
         
         if files:
             return "Repository structure:\n" + "\n".join(files)
@@ -220,16 +581,12 @@ def get_repository_commits(repository: str, branch: str = "main", limit: int = 1
     Returns:
         String representation of recent commits
     """
-    owner, repo = split_owner_repo(repository)
-    
     try:
         # Get commits via REST API
-        url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/commits"
+        url = f"{repo_base_url(repository)}/commits"
         params = {"sha": branch, "per_page": limit}
-        response = session.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        commits = response.json()
-        
+        commits = cached_get(url, params=params, timeout=30)
+
         if not commits:
             return "No commits found"
         
@@ -257,27 +614,22 @@ def get_repository_file(repository: str, file_path: str, branch: str = "main") -
     Returns:
         File contents as string, or None if file doesn't exist
     """
-    owner, repo = split_owner_repo(repository)
-    
     try:
-        # Get file contents via REST API
-        url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/contents/{file_path}"
+        # Get file contents via REST API. The raw media type returns the
+        # file body directly, skipping the base64+JSON round-trip through
+        # ~2.3x the file size in allocations.
+        url = f"{repo_base_url(repository)}/contents/{file_path}"
         params = {"ref": branch}
-        response = session.get(url, params=params, timeout=30)
-        
-        if response.status_code == 404:
-            return None
-        
-        response.raise_for_status()
-        data = response.json()
-        
-        # Decode base64 content
-        content = data.get("content", "")
-        if content:
-            return base64.b64decode(content).decode("utf-8")
-        
-        return None
-        
+        try:
+            content = cached_get(url, params=params, timeout=30,
+                                 accept="application/vnd.github.raw")
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            raise
+
+        return content if content else None
+
     except Exception as e:
         logger.warning(f"Error fetching file {file_path}: {e}")
         return None
@@ -8,11 +8,60 @@ import logging
 import requests
 from typing import Dict, Any, Optional, List
 
-from config import GITHUB_API_URL
-from github_api import session, split_owner_repo, get_repository_id, get_copilot_bot_id, graphql_query
+from github_api import cached_get, repo_base_url, get_repository_id, get_copilot_bot_id, graphql_query, ttl_cache
 
 logger = logging.getLogger(__name__)
 
+# GraphQL document at module scope so every call shares one string object
+_CREATE_ISSUE_MUTATION = """
+mutation($repoId: ID!, $title: String!, $body: String!, $botId: ID!) {
+  createIssue(input: {
+    repositoryId: $repoId,
+    title: $title,
+    body: $body,
+    assigneeIds: [$botId]
+  }) {
+    issue {
+      id
+      number
+      title
+      url
+      assignees(first: 10) {
+        nodes {
+          login
+        }
+      }
+    }
+  }
+}
+"""
+
+
+_CLOSE_ISSUE_MUTATION = """
+mutation($issueId: ID!) {
+  closeIssue(input: {issueId: $issueId}) {
+    issue {
+      number
+      state
+    }
+  }
+}
+"""
+
+_COMMENT_AND_CLOSE_ISSUE_MUTATION = """
+mutation($issueId: ID!, $body: String!) {
+  comment: addComment(input: {subjectId: $issueId, body: $body}) {
+    clientMutationId
+  }
+  close: closeIssue(input: {issueId: $issueId}) {
+    issue {
+      number
+      state
+    }
+  }
+}
+"""
+
 
 def create_issue_for_copilot(
     repository: str,
@@ -29,29 +78,6 @@ def create_issue_for_copilot(
     bot_id = get_copilot_bot_id(repository)
     
     # Create the issue and assign to Copilot in one mutation
-    mutation = """
-    mutation($repoId: ID!, $title: String!, $body: String!, $botId: ID!) {
-      createIssue(input: {
-        repositoryId: $repoId,
-        title: $title,
-        body: $body,
-        assigneeIds: [$botId]
-      }) {
-        issue {
-          id
-          number
-          title
-          url
-          assignees(first: 10) {
-            nodes {
-              login
-            }
-          }
-        }
-      }
-    }
-    """
-    
     variables = {
         "repoId": repo_id,
         "title": title,
@@ -59,7 +85,7 @@ def create_issue_for_copilot(
         "botId": bot_id,
     }
     
-    result = graphql_query(mutation, variables)
+    result = graphql_query(_CREATE_ISSUE_MUTATION, variables)
     
     issue_data = result.get("data", {}).get("createIssue", {}).get("issue", {})
     if not issue_data:
@@ -75,41 +101,44 @@ def create_issue_for_copilot(
     }
 
 
+@ttl_cache(seconds=15)
 def get_issue(repository: str, issue_number: int) -> Dict[str, Any]:
     """Fetch a GitHub issue by number."""
-    owner, repo = split_owner_repo(repository)
-    url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/issues/{issue_number}"
-    response = session.get(url, timeout=60)
-    response.raise_for_status()
-    return response.json()
+    url = f"{repo_base_url(repository)}/issues/{issue_number}"
+    return cached_get(url, timeout=60)
 
 
 def close_issue(repository: str, issue_number: int, comment: Optional[str] = None) -> bool:
     """Close a GitHub issue.
-    
-    Optionally add a comment before closing.
+
+    Optionally add a comment before closing. The comment and the close are
+    aliased mutations in one GraphQL document (GraphQL runs mutations in
+    order), so the comment-then-close pair costs a single round-trip
+    instead of two REST writes.
     Returns True if successful, False otherwise.
     """
-    owner, repo = split_owner_repo(repository)
-    
     try:
-        # Add comment if provided
+        issue_id = get_issue(repository, issue_number).get("node_id")
+        if not issue_id:
+            logger.error("[Issue #%d] Failed to close: no node_id", issue_number)
+            return False
+
         if comment:
-            comment_url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/issues/{issue_number}/comments"
-            comment_payload = {"body": comment}
-            comment_response = session.post(comment_url, json=comment_payload, timeout=60)
-            comment_response.raise_for_status()
-            print(f"[Issue #{issue_number}] Added closing comment")
-        
-        # Close the issue
-        url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/issues/{issue_number}"
-        payload = {"state": "closed"}
-        response = session.patch(url, json=payload, timeout=60)
-        response.raise_for_status()
-        print(f"[Issue #{issue_number}] ✓ Closed successfully")
+            result = graphql_query(_COMMENT_AND_CLOSE_ISSUE_MUTATION,
+                                   {"issueId": issue_id, "body": comment})
+        else:
+            result = graphql_query(_CLOSE_ISSUE_MUTATION, {"issueId": issue_id})
+
+        errors = result.get("errors")
+        if errors:
+            logger.error("[Issue #%d] Failed to close: %s", issue_number, errors)
+            return False
+
+        get_issue.invalidate(repository, issue_number)
+        logger.info("[Issue #%d] ✓ Closed successfully", issue_number)
         return True
     except requests.HTTPError as e:
-        print(f"[Issue #{issue_number}] Failed to close: {e}")
+        logger.error("[Issue #%d] Failed to close: %s", issue_number, e)
         if e.response is not None:
-            print(f"[Issue #{issue_number}] Response: {e.response.text}")
+            logger.error("[Issue #%d] Response: %s", issue_number, e.response.text)
         return False
@@ -5,10 +5,17 @@ This is the main entry point for the GitHub AutoPilot system.
 It orchestrates continuous improvement cycles using GitHub Copilot.
 """
 
+import atexit
+import queue
+import random
 import sys
+import threading
 import time
 import signal
 import logging
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional, Callable
 
 from config import (
@@ -25,28 +32,46 @@ from pr_manager import (
 from issue_manager import close_issue, get_issue
 from prompt_builder import build_improvement_prompt
 from metrics import metrics
-from github_api import split_owner_repo
+from github_api import split_owner_repo, wake_rate_limit_wait
 
-# Set up logging
+# Set up logging. Records go through an in-memory queue and a listener
+# thread does the actual stream/file writes, so log calls on the polling
+# paths never block on disk I/O.
+_log_queue: "queue.Queue" = queue.Queue(-1)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s [%(levelname)s] %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('improvement.log', mode='a')
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
+_log_listener = QueueListener(
+    _log_queue,
+    logging.StreamHandler(sys.stdout),
+    # Rotation bounds the log file on long-running loops; the listener
+    # thread already keeps these writes off the worker threads
+    RotatingFileHandler('improvement.log', maxBytes=10 * 1024 * 1024, backupCount=5),
+    respect_handler_level=True,
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
-# Global flag for graceful shutdown
-_shutdown_requested = False
+# REPOSITORY is fixed for the process, so parse it once at import time;
+# a malformed value now fails at startup instead of mid-cycle
+_OWNER, _REPO_NAME = split_owner_repo(REPOSITORY)
+_REPO_HTML_URL = f"https://github.com/{_OWNER}/{_REPO_NAME}"
+
+# Event for graceful shutdown; waiters wake immediately when it is set
+# instead of discovering the flag on their next 1-second tick
+_shutdown_event = threading.Event()
 
 
 def signal_handler(signum, frame):
     """Handle shutdown signals gracefully."""
-    global _shutdown_requested
     logger.info("Shutdown signal received. Finishing current cycle...")
-    _shutdown_requested = True
+    _shutdown_event.set()
+    # A thread parked in a rate-limit wait can block for up to an hour;
+    # wake it so shutdown isn't held hostage by quota exhaustion
+    wake_rate_limit_wait()
 
 
 # Register signal handlers
@@ -54,97 +79,195 @@ signal.signal(signal.SIGINT, signal_handler)
 signal.signal(signal.SIGTERM, signal_handler)
 
 
-def wait_for_existing_prs_to_complete(repository: str, timeout: int, 
+# Outcome of the shared ensure-base → mark-ready → wait-checks → merge
+# flow; base_ok=False means the PR was closed over a base-branch mismatch
+MergeOutcome = namedtuple("MergeOutcome", "base_ok checks_passed merged")
+
+
+def _merge_pr_flow(repository: str, pr_number: int,
+                   shutdown_check: Optional[Callable[[], bool]] = None) -> MergeOutcome:
+    """Run the merge pipeline shared by the pre-cycle and in-cycle paths.
+
+    Ensures the base branch, marks the PR ready for review, waits for
+    checks, and merges when they pass. Callers inspect the returned
+    MergeOutcome to do their own cleanup and metrics accounting.
+    """
+    if not ensure_pr_base_branch(repository, pr_number):
+        return MergeOutcome(base_ok=False, checks_passed=False, merged=False)
+
+    # Mark as ready for review if it's a draft
+    mark_pr_ready_for_review(repository, pr_number)
+
+    checks_passed = wait_for_pr_checks(repository, pr_number, shutdown_check=shutdown_check)
+    if not checks_passed:
+        return MergeOutcome(base_ok=True, checks_passed=False, merged=False)
+
+    merged = merge_pull_request(repository, pr_number)
+    return MergeOutcome(base_ok=True, checks_passed=True, merged=merged)
+
+
+def _handle_existing_pr(repository: str, pr: dict, timeout: int,
+                        shutdown_check: Optional[Callable[[], bool]] = None) -> bool:
+    """Wait for one existing Copilot PR and merge or clean it up.
+
+    Returns True when the PR was handled (merged, or failed and cleaned up),
+    False on timeout, shutdown, or a state requiring manual intervention.
+    """
+    pr_number = pr.get("number")
+    title = pr.get("title")
+
+    logger.info("[Pre-cycle check] PR #%s: %s", pr_number, title)
+
+    # Wait for this PR to be ready
+    pr_ready = wait_for_pr_ready(repository, pr_number, timeout, shutdown_check)
+
+    if not pr_ready:
+        logger.warning("[Pre-cycle check] ⚠️  PR #%s did not become ready in time", pr_number)
+        return False
+
+    # If auto-merge is enabled, try to merge it
+    if not AUTO_MERGE_PRS:
+        logger.warning("[Pre-cycle check] Auto-merge disabled - PR #%s left open", pr_number)
+        logger.warning("[Pre-cycle check] ⚠️  Please merge manually before starting new cycle")
+        return False
+
+    logger.info("[Pre-cycle check] Auto-merge enabled - attempting to merge PR #%s", pr_number)
+
+    outcome = _merge_pr_flow(repository, pr_number, shutdown_check)
+
+    if not outcome.base_ok:
+        logger.warning("[Pre-cycle check] ⚠️  Could not verify/update base branch for PR #%s", pr_number)
+        return False
+
+    if outcome.checks_passed:
+        if outcome.merged:
+            logger.info("[Pre-cycle check] ✓ PR #%s merged successfully", pr_number)
+
+            # Close the associated issue
+            issue_num = get_issue_number_from_pr(repository, pr_number)
+            if issue_num:
+                close_issue(repository, issue_num,
+                           f"PR #{pr_number} has been merged. Closing this issue.")
+        else:
+            logger.warning("[Pre-cycle check] ⚠️  Failed to merge PR #%s", pr_number)
+            return False
+    else:
+        logger.warning("[Pre-cycle check] ✗ Checks failed for PR #%s", pr_number)
+        logger.info("[Pre-cycle check] Closing failed PR and cleaning up...")
+
+        # Close the PR with explanation
+        close_pull_request(repository, pr_number,
+                         "This PR failed required checks and is being closed. "
+                         "A new improvement cycle will be started.")
+
+        # Close and clean up the associated issue
+        issue_num = get_issue_number_from_pr(repository, pr_number)
+        if issue_num:
+            close_issue(repository, issue_num,
+                       f"PR #{pr_number} failed checks and was closed. "
+                       "This issue is being closed as well.")
+
+        logger.info("[Pre-cycle check] ✓ Cleaned up failed PR #%s", pr_number)
+        # Treated as handled so the next cycle can start fresh
+
+    return True
+
+
+def wait_for_existing_prs_to_complete(repository: str, timeout: int,
                                      shutdown_check: Optional[Callable[[], bool]] = None) -> bool:
     """Check for existing open Copilot PRs and wait for them to be ready.
-    
+
+    Independent PRs are polled concurrently, so the pre-cycle phase is
+    bounded by the slowest PR instead of the sum of all of them.
+
     Args:
         repository: Repository in owner/repo format
         timeout: Maximum seconds to wait
         shutdown_check: Optional callable that returns True if shutdown was requested
-    
+
     Returns True if all PRs are ready or no PRs exist, False on timeout or shutdown.
     """
-    print("\n[Pre-cycle check] Checking for existing open Copilot PRs...")
-    
+    logger.info("[Pre-cycle check] Checking for existing open Copilot PRs...")
+
     copilot_prs = get_open_copilot_prs(repository)
-    
+
     if not copilot_prs:
-        print("[Pre-cycle check] No existing open Copilot PRs found")
+        logger.info("[Pre-cycle check] No existing open Copilot PRs found")
         return True
-    
-    print(f"[Pre-cycle check] Found {len(copilot_prs)} open Copilot PR(s)")
-    
-    for pr in copilot_prs:
-        pr_number = pr.get("number")
-        title = pr.get("title")
-        
-        print(f"[Pre-cycle check] PR #{pr_number}: {title}")
-        
-        # Wait for this PR to be ready
-        pr_ready = wait_for_pr_ready(repository, pr_number, timeout, shutdown_check)
-        
-        if not pr_ready:
-            print(f"[Pre-cycle check] ⚠️  PR #{pr_number} did not become ready in time")
-            return False
-        
-        # If auto-merge is enabled, try to merge it
-        if AUTO_MERGE_PRS:
-            print(f"[Pre-cycle check] Auto-merge enabled - attempting to merge PR #{pr_number}")
-            
-            # Ensure PR is targeting the correct base branch
-            base_ok = ensure_pr_base_branch(repository, pr_number)
-            if not base_ok:
-                print(f"[Pre-cycle check] ⚠️  Could not verify/update base branch for PR #{pr_number}")
-                return False
-            
-            # Mark as ready for review if it's a draft
-            mark_pr_ready_for_review(repository, pr_number)
-            
-            checks_passed = wait_for_pr_checks(repository, pr_number, shutdown_check=shutdown_check)
-            
-            if checks_passed:
-                merge_success = merge_pull_request(repository, pr_number)
-                
-                if merge_success:
-                    print(f"[Pre-cycle check] ✓ PR #{pr_number} merged successfully")
-                    
-                    # Close the associated issue
-                    issue_num = get_issue_number_from_pr(repository, pr_number)
-                    if issue_num:
-                        close_issue(repository, issue_num, 
-                                   f"PR #{pr_number} has been merged. Closing this issue.")
-                else:
-                    print(f"[Pre-cycle check] ⚠️  Failed to merge PR #{pr_number}")
-                    return False
-            else:
-                print(f"[Pre-cycle check] ✗ Checks failed for PR #{pr_number}")
-                print(f"[Pre-cycle check] Closing failed PR and cleaning up...")
-                
-                # Close the PR with explanation
-                close_pull_request(repository, pr_number, 
-                                 "This PR failed required checks and is being closed. "
-                                 "A new improvement cycle will be started.")
-                
-                # Close and clean up the associated issue
-                issue_num = get_issue_number_from_pr(repository, pr_number)
-                if issue_num:
-                    close_issue(repository, issue_num, 
-                               f"PR #{pr_number} failed checks and was closed. "
-                               "This issue is being closed as well.")
-                
-                print(f"[Pre-cycle check] ✓ Cleaned up failed PR #{pr_number}")
-                # Continue to next cycle instead of failing
-                continue
-        else:
-            print(f"[Pre-cycle check] Auto-merge disabled - PR #{pr_number} left open")
-            print(f"[Pre-cycle check] ⚠️  Please merge manually before starting new cycle")
-            return False
-    
-    print("[Pre-cycle check] ✓ All existing PRs handled")
+
+    logger.info("[Pre-cycle check] Found %d open Copilot PR(s)", len(copilot_prs))
+
+    if len(copilot_prs) == 1:
+        results = [_handle_existing_pr(repository, copilot_prs[0], timeout, shutdown_check)]
+    else:
+        # The per-PR pipelines are pure GitHub I/O with no shared state, so
+        # run them in parallel worker threads over the pooled session
+        with ThreadPoolExecutor(max_workers=min(8, len(copilot_prs))) as executor:
+            futures = [
+                executor.submit(_handle_existing_pr, repository, pr, timeout, shutdown_check)
+                for pr in copilot_prs
+            ]
+            results = [future.result() for future in as_completed(futures)]
+
+    if not all(results):
+        return False
+
+    logger.info("[Pre-cycle check] ✓ All existing PRs handled")
     return True
 
 
+def _await_new_copilot_pr(repository: str, timeout: int = 300,
+                          shutdown_check: Optional[Callable[[], bool]] = None) -> Optional[int]:
+    """Poll until the just-queued Copilot job creates its PR.
+
+    The pre-cycle gate guarantees no Copilot PRs are open when a cycle
+    triggers, so the first one to appear belongs to this cycle.
+
+    Returns the PR number, or None on timeout or shutdown.
+    """
+    # Monotonic deadline: immune to wall-clock jumps from NTP corrections
+    start = time.monotonic()
+    deadline = start + timeout
+    attempt = 0
+
+    while time.monotonic() < deadline:
+        # Check for shutdown request
+        if shutdown_check and shutdown_check():
+            logger.info("Shutdown requested during PR creation wait")
+            return None
+
+        # The pre-cycle check primed the 15s TTL cache with an empty
+        # listing; drop that entry so each poll hits the API and can
+        # actually observe the new PR at the fast-backoff cadence
+        get_open_copilot_prs.invalidate(repository)
+        copilot_prs = get_open_copilot_prs(repository)
+
+        if copilot_prs:
+            # Get the most recent PR
+            pr_number = copilot_prs[0].get("number")
+            logger.info("✓ Found Copilot PR #%s", pr_number)
+            return pr_number
+
+        elapsed = int(time.monotonic() - start)
+        logger.info("Waiting for PR creation... (%ds elapsed)", elapsed)
+
+        # Exponential backoff with jitter: a 1s first poll catches PRs
+        # that appear almost immediately, then capped growth while the
+        # PR still hasn't shown up
+        delay = min(30, 2 ** attempt) * (0.5 + random.random())
+        attempt += 1
+
+        # Sleep in small increments to check for shutdown
+        sleep_until = time.monotonic() + delay
+        while time.monotonic() < sleep_until:
+            if shutdown_check and shutdown_check():
+                logger.info("Shutdown requested during PR creation wait")
+                return None
+            time.sleep(1)
+
+    return None
+
+
 def run_single_improvement_cycle(cycle_index: int, shutdown_check: Optional[Callable[[], bool]] = None) -> None:
     """Run one improvement cycle.
     
@@ -158,7 +281,7 @@ def run_single_improvement_cycle(cycle_index: int, shutdown_check: Optional[Call
         cycle_index: Current cycle number
         shutdown_check: Optional callable that returns True if shutdown was requested
     """
-    print(f"\n========== Starting improvement cycle #{cycle_index} ==========")
+    logger.info("========== Starting improvement cycle #%d ==========", cycle_index)
     
     # Check for existing open PRs before starting new cycle
     existing_prs_ready = wait_for_existing_prs_to_complete(
@@ -171,11 +294,11 @@ def run_single_improvement_cycle(cycle_index: int, shutdown_check: Optional[Call
             "Please resolve existing PRs before starting a new cycle."
         )
     
-    print(f"\n[Cycle #{cycle_index}] Ready to trigger Copilot\n")
+    logger.info("[Cycle #%d] Ready to trigger Copilot", cycle_index)
 
     prompt = build_improvement_prompt(REPOSITORY, BASE_BRANCH)
 
-    print(f"Triggering Copilot via gh CLI (base branch: {BASE_BRANCH})...")
+    logger.info("Triggering Copilot via gh CLI (base branch: %s)...", BASE_BRANCH)
     pr_number = trigger_copilot_via_gh_cli(REPOSITORY, BASE_BRANCH, prompt)
     
     if pr_number is None:
@@ -184,101 +307,67 @@ def run_single_improvement_cycle(cycle_index: int, shutdown_check: Optional[Call
     # If pr_number is -1, it means job was queued but PR not created yet
     # We need to poll for the PR to be created
     if pr_number == -1:
-        print(f"\nPolling for Copilot to create PR...")
-        
-        # Get all open Copilot PRs and wait for a new one
-        start_time = time.time()
+        logger.info("Polling for Copilot to create PR...")
+
         max_wait = 300  # 5 minutes to create PR
-        
-        while (time.time() - start_time) < max_wait:
-            # Check for shutdown request
+        pr_number = _await_new_copilot_pr(REPOSITORY, max_wait, shutdown_check)
+
+        if pr_number is None:
             if shutdown_check and shutdown_check():
-                logger.info("Shutdown requested during PR creation wait")
                 return
-            
-            copilot_prs = get_open_copilot_prs(REPOSITORY)
-            
-            if copilot_prs:
-                # Get the most recent PR
-                latest_pr = copilot_prs[0]
-                pr_number = latest_pr.get("number")
-                print(f"✓ Found Copilot PR #{pr_number}")
-                break
-            
-            elapsed = int(time.time() - start_time)
-            print(f"Waiting for PR creation... ({elapsed}s elapsed)")
-            
-            # Sleep in small increments to check for shutdown
-            for _ in range(10):
-                if shutdown_check and shutdown_check():
-                    logger.info("Shutdown requested during PR creation wait")
-                    return
-                time.sleep(1)
-        
-        if pr_number == -1:
             raise RuntimeError(f"Copilot did not create a PR within {max_wait}s")
 
-    print(f"\n=== Copilot Triggered ===")
-    print(f"PR #{pr_number} created")
-    owner, repo = split_owner_repo(REPOSITORY)
-    pr_url = f"https://github.com/{owner}/{repo}/pull/{pr_number}"
-    print(f"URL: {pr_url}")
+    logger.info("=== Copilot Triggered ===")
+    logger.info("PR #%s created", pr_number)
+    pr_url = f"{_REPO_HTML_URL}/pull/{pr_number}"
+    logger.info("URL: %s", pr_url)
     
     # Track metrics
     metrics.record_pr_created(pr_number)
 
     # Automatically merge the PR if enabled
     if AUTO_MERGE_PRS:
-        print(f"\n[PR #{pr_number}] Auto-merge enabled - attempting to merge...")
+        logger.info("[PR #%s] Auto-merge enabled - attempting to merge...", pr_number)
         
         # Wait for Copilot to finish working (no WIP, reviewer assigned)
         pr_ready = wait_for_pr_ready(REPOSITORY, pr_number, shutdown_check=shutdown_check)
         
         if not pr_ready:
-            print(f"[PR #{pr_number}] ⚠️  PR did not become ready in time - skipping merge")
-            print(f"[PR #{pr_number}] Copilot may still be working on it")
+            logger.warning("[PR #%s] ⚠️  PR did not become ready in time - skipping merge", pr_number)
+            logger.warning("[PR #%s] Copilot may still be working on it", pr_number)
         else:
-            # Verify base branch is correct (should be since we specified it)
-            base_ok = ensure_pr_base_branch(REPOSITORY, pr_number)
-            if not base_ok:
-                print(f"[PR #{pr_number}] ⚠️  Base branch issue - PR was closed")
-                print(f"[Cycle #{cycle_index}] Will retry with a new cycle")
+            outcome = _merge_pr_flow(REPOSITORY, pr_number, shutdown_check)
+
+            if not outcome.base_ok:
+                logger.warning("[PR #%s] ⚠️  Base branch issue - PR was closed", pr_number)
+                logger.info("[Cycle #%d] Will retry with a new cycle", cycle_index)
                 return
-            
-            # Mark as ready for review if it's a draft
-            mark_pr_ready_for_review(REPOSITORY, pr_number)
-            
-            # Wait for checks to complete
-            checks_passed = wait_for_pr_checks(REPOSITORY, pr_number, shutdown_check=shutdown_check)
-            
-            if checks_passed:
-                # Attempt to merge
-                merge_success = merge_pull_request(REPOSITORY, pr_number)
-                
-                if merge_success:
-                    print(f"[PR #{pr_number}] ✓ PR merged successfully!")
-                    print(f"[PR #{pr_number}] Changes are now in {BASE_BRANCH}")
+
+            if outcome.checks_passed:
+                if outcome.merged:
+                    logger.info("[PR #%s] ✓ PR merged successfully!", pr_number)
+                    logger.info("[PR #%s] Changes are now in %s", pr_number, BASE_BRANCH)
                     metrics.record_pr_merged()
                 else:
-                    print(f"[PR #{pr_number}] ⚠️  Failed to merge PR - continuing anyway")
+                    logger.warning("[PR #%s] ⚠️  Failed to merge PR - continuing anyway", pr_number)
                     metrics.record_pr_failed()
             else:
-                print(f"[PR #{pr_number}] ✗ Checks failed - closing PR")
+                logger.warning("[PR #%s] ✗ Checks failed - closing PR", pr_number)
                 metrics.record_checks_failed()
                 metrics.record_pr_failed()
-                
+
                 # Close the PR with explanation
-                close_pull_request(REPOSITORY, pr_number, 
+                close_pull_request(REPOSITORY, pr_number,
                                  "This PR failed required checks and is being closed. "
                                  "A new improvement cycle will be started.")
-                
-                print(f"[PR #{pr_number}] ✓ Cleaned up failed PR")
-                print(f"[Cycle #{cycle_index}] Will retry with a new cycle")
+
+                logger.info("[PR #%s] ✓ Cleaned up failed PR", pr_number)
+                logger.info("[Cycle #%d] Will retry with a new cycle", cycle_index)
     else:
-        print(f"\n[PR #{pr_number}] Auto-merge disabled - PR left open for manual review")
-        print(f"[PR #{pr_number}] Review and merge manually: {pr_url}")
+        logger.info("[PR #%s] Auto-merge disabled - PR left open for manual review", pr_number)
+        logger.info("[PR #%s] Review and merge manually: %s", pr_number, pr_url)
 
-    print(f"========== Finished improvement cycle #{cycle_index} ==========\n")
+    logger.info("========== Finished improvement cycle #%d ==========", cycle_index)
 
 
 def continuous_improvement_loop() -> None:
@@ -293,31 +382,33 @@ def continuous_improvement_loop() -> None:
 
     You can stop the loop with Ctrl+C for graceful shutdown.
     """
-    global _shutdown_requested
-    
     cycle_index = 1
     consecutive_failures = 0
     successful_cycles = 0
     
     metrics.start_cycle()
     
-    logger.info("="*60)
-    logger.info("Starting Continuous Improvement Loop")
-    logger.info("="*60)
-    logger.info(f"Repository: {REPOSITORY}")
-    logger.info(f"Base Branch: {BASE_BRANCH}")
-    logger.info(f"Auto-merge: {AUTO_MERGE_PRS}")
-    logger.info(f"Max Cycles: {MAX_CYCLES if MAX_CYCLES > 0 else 'Unlimited'}")
-    logger.info(f"Delay Between Cycles: {DELAY_BETWEEN_CYCLES_SECONDS}s")
-    logger.info("="*60)
+    # One record for the whole banner: a single lock acquisition and a
+    # single handler write instead of nine
+    logger.info("\n".join([
+        "=" * 60,
+        "Starting Continuous Improvement Loop",
+        "=" * 60,
+        f"Repository: {REPOSITORY}",
+        f"Base Branch: {BASE_BRANCH}",
+        f"Auto-merge: {AUTO_MERGE_PRS}",
+        f"Max Cycles: {MAX_CYCLES if MAX_CYCLES > 0 else 'Unlimited'}",
+        f"Delay Between Cycles: {DELAY_BETWEEN_CYCLES_SECONDS}s",
+        "=" * 60,
+    ]))
     
     # Create a shutdown check lambda
-    shutdown_check = lambda: _shutdown_requested
-    
+    shutdown_check = _shutdown_event.is_set
+
     try:
         while True:
             # Check if shutdown requested
-            if _shutdown_requested:
+            if _shutdown_event.is_set():
                 logger.info("Shutdown requested. Stopping gracefully.")
                 break
             
@@ -345,31 +436,31 @@ def continuous_improvement_loop() -> None:
             cycle_index += 1
             
             # Delay before next cycle (unless shutting down)
-            if not _shutdown_requested and (MAX_CYCLES == 0 or cycle_index <= MAX_CYCLES):
+            if not _shutdown_event.is_set() and (MAX_CYCLES == 0 or cycle_index <= MAX_CYCLES):
                 if DELAY_BETWEEN_CYCLES_SECONDS > 0:
                     logger.info(f"Waiting {DELAY_BETWEEN_CYCLES_SECONDS}s before next cycle...")
-                    # Sleep in small increments to allow graceful shutdown
-                    for _ in range(DELAY_BETWEEN_CYCLES_SECONDS):
-                        if _shutdown_requested:
-                            break
-                        time.sleep(1)
+                    # One kernel wait that returns immediately on shutdown
+                    _shutdown_event.wait(timeout=DELAY_BETWEEN_CYCLES_SECONDS)
     
     finally:
         summary = metrics.get_summary()
         
-        logger.info("="*60)
-        logger.info("Continuous Improvement Loop Finished")
-        logger.info("="*60)
-        logger.info(f"Total Runtime: {summary['total_runtime_seconds']}s ({summary['total_runtime_minutes']}m)")
-        logger.info(f"Total Cycles Attempted: {cycle_index - 1}")
-        logger.info(f"Successful Cycles: {successful_cycles}")
-        logger.info(f"Failed Cycles: {(cycle_index - 1) - successful_cycles}")
-        logger.info(f"PRs Created: {summary['prs_created']}")
-        logger.info(f"PRs Merged: {summary['prs_merged']}")
-        logger.info(f"PRs Failed: {summary['prs_failed']}")
+        lines = [
+            "=" * 60,
+            "Continuous Improvement Loop Finished",
+            "=" * 60,
+            f"Total Runtime: {summary['total_runtime_seconds']}s ({summary['total_runtime_minutes']}m)",
+            f"Total Cycles Attempted: {cycle_index - 1}",
+            f"Successful Cycles: {successful_cycles}",
+            f"Failed Cycles: {(cycle_index - 1) - successful_cycles}",
+            f"PRs Created: {summary['prs_created']}",
+            f"PRs Merged: {summary['prs_merged']}",
+            f"PRs Failed: {summary['prs_failed']}",
+        ]
         if summary['pr_numbers']:
-            logger.info(f"PR Numbers: {', '.join(f'#{n}' for n in summary['pr_numbers'])}")
-        logger.info("="*60)
+            lines.append(f"PR Numbers: {', '.join(f'#{n}' for n in summary['pr_numbers'])}")
+        lines.append("=" * 60)
+        logger.info("\n".join(lines))
 
 
 def main():
@@ -3,61 +3,114 @@
 This module provides simple metrics tracking for the continuous improvement loop.
 """
 
+import json
+import logging
+import os
+import threading
 import time
+from collections import Counter
 from typing import Dict, Any
 
+logger = logging.getLogger(__name__)
+
+# On-disk checkpoint so counts survive a crash or MAX_CONSECUTIVE_FAILURES
+# exit instead of having to be reconstructed from the log
+_CHECKPOINT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "github-autopilot", "metrics.json")
+_CHECKPOINT_VERSION = 1
+
 
 class Metrics:
-    """Track metrics for the continuous improvement loop."""
-    
+    """Track metrics for the continuous improvement loop.
+
+    PR pipelines record from worker threads, so one lock guards every
+    increment together with the checkpoint write that follows it:
+    ``Counter.update`` is a Python-level read-modify-write loop, and two
+    unsynchronized checkpoint rewrites could interleave on disk.
+    """
+
     def __init__(self):
-        self.total_prs_created = 0
-        self.total_prs_merged = 0
-        self.total_prs_failed = 0
-        self.total_checks_passed = 0
-        self.total_checks_failed = 0
+        self._counts = Counter()
         self.cycle_start_time = None
         self.pr_numbers = []
-    
+        self._lock = threading.Lock()
+        self._load_checkpoint()
+
+    def _load_checkpoint(self):
+        """Restore counts from the previous run's checkpoint, if any."""
+        try:
+            with open(_CHECKPOINT_PATH, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != _CHECKPOINT_VERSION:
+            return
+        self._counts.update(data.get("counts", {}))
+        self.pr_numbers.extend(data.get("pr_numbers", []))
+
+    def _checkpoint(self):
+        """Persist current counts to disk; failures only cost the history."""
+        try:
+            os.makedirs(os.path.dirname(_CHECKPOINT_PATH), exist_ok=True)
+            with open(_CHECKPOINT_PATH, "w", encoding="utf-8") as f:
+                json.dump({
+                    "version": _CHECKPOINT_VERSION,
+                    "counts": dict(self._counts),
+                    "pr_numbers": self.pr_numbers,
+                    "saved_at": time.time(),
+                }, f)
+        except OSError as e:
+            logger.debug(f"Could not persist metrics checkpoint: {e}")
+
     def start_cycle(self):
         """Mark the start of a new cycle."""
         self.cycle_start_time = time.time()
-    
+
     def record_pr_created(self, pr_number: int):
         """Record that a PR was created."""
-        self.total_prs_created += 1
-        self.pr_numbers.append(pr_number)
-    
+        with self._lock:
+            self._counts.update({"prs_created": 1})
+            self.pr_numbers.append(pr_number)
+            self._checkpoint()
+
     def record_pr_merged(self):
         """Record that a PR was merged."""
-        self.total_prs_merged += 1
-    
+        with self._lock:
+            self._counts.update({"prs_merged": 1})
+            self._checkpoint()
+
     def record_pr_failed(self):
         """Record that a PR failed."""
-        self.total_prs_failed += 1
-    
+        with self._lock:
+            self._counts.update({"prs_failed": 1})
+            self._checkpoint()
+
     def record_checks_passed(self):
         """Record that checks passed."""
-        self.total_checks_passed += 1
-    
+        with self._lock:
+            self._counts.update({"checks_passed": 1})
+            self._checkpoint()
+
     def record_checks_failed(self):
         """Record that checks failed."""
-        self.total_checks_failed += 1
-    
+        with self._lock:
+            self._counts.update({"checks_failed": 1})
+            self._checkpoint()
+
     def get_summary(self) -> Dict[str, Any]:
         """Get a summary of all metrics."""
         total_time = time.time() - self.cycle_start_time if self.cycle_start_time else 0
-        
-        return {
-            "total_runtime_seconds": int(total_time),
-            "total_runtime_minutes": int(total_time / 60),
-            "prs_created": self.total_prs_created,
-            "prs_merged": self.total_prs_merged,
-            "prs_failed": self.total_prs_failed,
-            "checks_passed": self.total_checks_passed,
-            "checks_failed": self.total_checks_failed,
-            "pr_numbers": self.pr_numbers,
-        }
+
+        with self._lock:
+            return {
+                "total_runtime_seconds": int(total_time),
+                "total_runtime_minutes": int(total_time / 60),
+                "prs_created": self._counts["prs_created"],
+                "prs_merged": self._counts["prs_merged"],
+                "prs_failed": self._counts["prs_failed"],
+                "checks_passed": self._counts["checks_passed"],
+                "checks_failed": self._counts["checks_failed"],
+                "pr_numbers": list(self.pr_numbers),
+            }
 
 
 # Global metrics instance
@@ -8,161 +8,24 @@ The prompts are generally applicable and adapt to any repository based on:
 """
 
 import os
+import select
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
-from github_api import split_owner_repo, get_repository_tree, get_repository_commits, get_repository_file
+from github_api import split_owner_repo, get_repository_overview, get_repository_file
 
 
-def get_repository_structure(repo_path: str = ".") -> str:
-    """Get a summary of the repository structure.
-    
-    Args:
-        repo_path: Path to the repository (default: current directory)
-        
-    Returns:
-        String representation of the repository structure
-    """
-    try:
-        # Use tree command if available, otherwise fall back to find
-        tree_cmd = subprocess.run(
-            ["tree", "-L", "2", "-I", "node_modules|.git|__pycache__|*.pyc|dist|build", repo_path],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        
-        if tree_cmd.returncode == 0:
-            return tree_cmd.stdout
-        
-        # Fallback: use find command
-        find_cmd = subprocess.run(
-            ["find", repo_path, "-maxdepth", "2", "-type", "f", 
-             "!", "-path", "*/.*", "!", "-path", "*/node_modules/*", 
-             "!", "-path", "*/__pycache__/*"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        
-        if find_cmd.returncode == 0 and find_cmd.stdout.strip():
-            files = find_cmd.stdout.strip().split("\n")
-            return "Repository files:\n" + "\n".join(f"  {f}" for f in files[:50])  # Limit to 50 files
-        
-        return "Unable to determine repository structure"
-        
-    except Exception as e:
-        return f"Error reading repository structure: {e}"
-
-
-def get_recent_commits(repo_path: str = ".", limit: int = 10) -> str:
-    """Get recent commit history.
-    
-    Args:
-        repo_path: Path to the repository (default: current directory)
-        limit: Number of recent commits to fetch
-        
-    Returns:
-        String representation of recent commits
-    """
-    try:
-        result = subprocess.run(
-            ["git", "-C", repo_path, "log", f"-{limit}", "--oneline", "--decorate"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        
-        if result.returncode == 0:
-            return result.stdout.strip()
-        
-        return "Unable to fetch commit history"
-        
-    except Exception as e:
-        return f"Error reading commit history: {e}"
-
-
-def read_context_file(repo_path: str = ".") -> Optional[str]:
-    """Read the CONTEXT.md file if it exists.
-    
-    Args:
-        repo_path: Path to the repository (default: current directory)
-        
-    Returns:
-        Contents of CONTEXT.md or None if it doesn't exist
-    """
-    context_path = os.path.join(repo_path, "CONTEXT.md")
-    
-    if os.path.exists(context_path):
-        try:
-            with open(context_path, "r", encoding="utf-8") as f:
-                return f.read()
-        except Exception as e:
-            return f"Error reading CONTEXT.md: {e}"
-    
-    return None
-
-
-def build_improvement_prompt(repository: str, base_branch: str) -> str:
-    """Build a comprehensive improvement prompt for Copilot coding agent.
-    
-    This implementation is generally applicable to any repository. It:
-    - Analyzes the repository structure
-    - Reviews recent commits
-    - Reads project-specific context from CONTEXT.md (if present)
-    - Instructs the agent to generate and work on prioritized tasks
-    
-    Args:
-        repository: Repository in 'owner/repo' format
-        base_branch: Target branch for improvements
-        
-    Returns:
-        Formatted prompt string for Copilot
-    """
-    owner, repo = split_owner_repo(repository)
-    
-    # Gather repository information from the target repository via GitHub API
-    repo_structure = get_repository_tree(repository, base_branch)
-    recent_commits = get_repository_commits(repository, base_branch)
-    context_content = get_repository_file(repository, "CONTEXT.md", base_branch)
-    
-    # Build the prompt
-    prompt_parts = []
-    
-    # Header
-    prompt_parts.append(f"""You are working on the repository {owner}/{repo} (branch: {base_branch}).
-
-Your role is to continuously improve this codebase by identifying and implementing the next most valuable changes.""")
-    
-    # Repository structure
-    prompt_parts.append(f"""
-## REPOSITORY STRUCTURE
-
-{repo_structure}
-""")
-    
-    # Recent commits
-    prompt_parts.append(f"""
-## RECENT COMMITS (Last 10)
-
-{recent_commits}
-""")
-    
-    # Project-specific context
-    if context_content:
-        prompt_parts.append(f"""
-## PROJECT CONTEXT (from CONTEXT.md)
-
-{context_content}
-""")
-    else:
-        prompt_parts.append("""
+# The instruction sections of the prompt never change between cycles, so
+# they are built once at import time instead of being re-materialized as
+# multi-kilobyte literals on every call.
+_NO_CONTEXT_SECTION = """
 ## PROJECT CONTEXT
 
 No CONTEXT.md file found. Use the repository structure, code, and commit history to understand the project.
-""")
-    
-    # Core instructions
-    prompt_parts.append("""
+"""
+
+_CORE_INSTRUCTIONS = """
 ## YOUR TASK - CYCLE-BASED CONTINUOUS IMPROVEMENT
 
 ### At the START of Each Cycle:
@@ -193,7 +56,7 @@ No CONTEXT.md file found. Use the repository structure, code, and commit history
      * New insights from your work
      * Updated context from CONTEXT.md
      * Recent commits from other contributors
-   
+
 3. **Prepare for Next Cycle:**
    - Note what should be done next (for the next agent cycle)
    - Ensure your work integrates cleanly
@@ -234,7 +97,7 @@ No CONTEXT.md file found. Use the repository structure, code, and commit history
 
 1. **Working Code:** Complete implementation of your highest-priority task
 2. **Tests:** Unit tests validating your changes
-3. **PR Description:** 
+3. **PR Description:**
    - Clear title describing what you did
    - Checklist showing completed and remaining prioritized tasks
    - Brief explanation of changes
@@ -250,6 +113,266 @@ No CONTEXT.md file found. Use the repository structure, code, and commit history
 - Security vulnerabilities must be avoided
 
 Begin by analyzing the repository and generating your prioritized task list. Then implement the top priority item.
-""")
+"""
+
+# The invariant tail of every prompt, normalized once; the bytes form lets
+# callers that re-encode for HTTP skip a UTF-8 pass over the static bulk
+_STATIC_TAIL = _CORE_INSTRUCTIONS.rstrip()
+_STATIC_TAIL_BYTES = _STATIC_TAIL.encode("utf-8")
+
+
+# Shared pool for the two prompt fetches. A ThreadPoolExecutor only spawns
+# workers on first submit, so creating it at import is free, and reusing it
+# avoids paying thread startup/teardown on every cycle.
+_fetch_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="prompt-fetch")
+
+
+# Directories never descended into when walking the local tree; pruning
+# here means their contents are never even stat'd
+_SKIP_DIRS = frozenset({".git", "node_modules", "__pycache__", "dist", "build"})
+
+
+# Output quota for structure listings; the walk stops scanning once it
+# is filled rather than listing everything and slicing afterwards
+_MAX_STRUCTURE_ENTRIES = 50
+
+
+def _walk(path: str, depth: int, prefix: str = "",
+          budget: int = _MAX_STRUCTURE_ENTRIES) -> list:
+    """List up to budget entries under path, pruning skipped dirs."""
+    lines = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if len(lines) >= budget:
+                    break
+                if entry.name.startswith(".") or entry.name in _SKIP_DIRS:
+                    continue
+                if entry.name.endswith(".pyc"):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    lines.append(f"{prefix}{entry.name}/")
+                    if depth > 1:
+                        lines.extend(_walk(entry.path, depth - 1, prefix + "  ",
+                                           budget - len(lines)))
+                else:
+                    lines.append(f"{prefix}{entry.name}")
+    except OSError:
+        pass
+    return lines
+
+
+def get_repository_structure(repo_path: str = ".") -> str:
+    """Get a summary of the repository structure.
+
+    Args:
+        repo_path: Path to the repository (default: current directory)
+
+    Returns:
+        String representation of the repository structure
+    """
+    try:
+        lines = _walk(repo_path, depth=2)
+
+        if lines:
+            return "Repository files:\n" + "\n".join(f"  {line}" for line in lines)
+
+        return "Unable to determine repository structure"
+
+    except Exception as e:
+        return f"Error reading repository structure: {e}"
+
+
+def _run_with_deadline(cmd: list, deadline_s: float) -> tuple:
+    """Run cmd, reading stdout incrementally against a monotonic deadline.
+
+    Unlike subprocess.run(timeout=...), which blocks the caller for the
+    full timeout when the child wedges, this kills the process and raises
+    TimeoutExpired the moment the budget runs out.
+
+    Returns:
+        (returncode, decoded stdout) tuple
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+
+    if os.name == "nt":
+        # select() only supports sockets on Windows; fall back to
+        # communicate's own timeout handling there
+        try:
+            stdout, _ = proc.communicate(timeout=deadline_s)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+        return proc.returncode, stdout.decode("utf-8", errors="replace")
+
+    deadline = time.monotonic() + deadline_s
+    chunks = []
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                proc.kill()
+                proc.wait()
+                raise subprocess.TimeoutExpired(cmd, deadline_s)
+            ready, _, _ = select.select([proc.stdout], [], [], remaining)
+            if not ready:
+                continue
+            chunk = os.read(proc.stdout.fileno(), 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        proc.stdout.close()
+    return proc.wait(), b"".join(chunks).decode("utf-8", errors="replace")
+
+
+def get_recent_commits(repo_path: str = ".", limit: int = 10) -> str:
+    """Get recent commit history.
+
+    Args:
+        repo_path: Path to the repository (default: current directory)
+        limit: Number of recent commits to fetch
+
+    Returns:
+        String representation of recent commits
+    """
+    try:
+        returncode, output = _run_with_deadline(
+            ["git", "-C", repo_path, "log", f"-{limit}", "--oneline", "--decorate"],
+            deadline_s=10,
+        )
+
+        if returncode == 0:
+            return output.strip()
+
+        return "Unable to fetch commit history"
+
+    except Exception as e:
+        return f"Error reading commit history: {e}"
+
+
+# Content cache for CONTEXT.md keyed by path; a stat comparison decides
+# whether the cached text is still current, so steady-state reads cost one
+# syscall instead of open+read
+_ctx_cache: dict = {}
+
+# Largest slice of CONTEXT.md ever loaded into the prompt; anything past
+# this would blow the token budget long before it helped the agent
+_MAX_CONTEXT_BYTES = 256 * 1024
+
+
+def read_context_file(repo_path: str = ".") -> Optional[str]:
+    """Read the CONTEXT.md file if it exists.
+
+    The content is cached per path and invalidated when the file's mtime
+    or size changes, so unchanged files are not re-read every call.
+
+    Args:
+        repo_path: Path to the repository (default: current directory)
+
+    Returns:
+        Contents of CONTEXT.md or None if it doesn't exist
+    """
+    context_path = os.path.join(repo_path, "CONTEXT.md")
+
+    try:
+        st = os.stat(context_path)
+    except OSError:
+        _ctx_cache.pop(context_path, None)
+        return None
+
+    stamp = (st.st_mtime_ns, st.st_size)
+    entry = _ctx_cache.get(context_path)
+    if entry and entry[0] == stamp:
+        return entry[1]
+
+    try:
+        with open(context_path, "rb") as f:
+            raw = f.read(_MAX_CONTEXT_BYTES)
+        # A NUL byte means this isn't the markdown file we expect; don't
+        # paste binary junk into the prompt
+        if b"\x00" in raw:
+            return None
+        content = raw.decode("utf-8", errors="replace")
+        if st.st_size > _MAX_CONTEXT_BYTES:
+            content += "\n\n[CONTEXT.md truncated: file exceeds 256 KiB]"
+    except Exception as e:
+        return f"Error reading CONTEXT.md: {e}"
+
+    _ctx_cache[context_path] = (stamp, content)
+    return content
+
+
+def _dynamic_prefix(repository: str, base_branch: str) -> str:
+    """Build the per-cycle portion of the prompt (everything before the
+    invariant instruction tail)."""
+    owner, repo = split_owner_repo(repository)
+
+    # Gather repository information from the target repository via GitHub API.
+    # Tree and commits come back in one fused GraphQL round-trip; the
+    # CONTEXT.md fetch is independent and runs concurrently with it.
+    overview_future = _fetch_pool.submit(get_repository_overview, repository, base_branch)
+    context_future = _fetch_pool.submit(get_repository_file, repository, "CONTEXT.md", base_branch)
+
+    repo_structure, recent_commits = overview_future.result()
+    context_content = context_future.result()
     
-    return "\n".join(prompt_parts).strip()
+    # One f-string assembles the whole prompt in a single allocation pass;
+    # only the context section needs a branch
+    if context_content:
+        context_block = f"""
+## PROJECT CONTEXT (from CONTEXT.md)
+
+{context_content}
+"""
+    else:
+        context_block = _NO_CONTEXT_SECTION
+
+    return f"""You are working on the repository {owner}/{repo} (branch: {base_branch}).
+
+Your role is to continuously improve this codebase by identifying and implementing the next most valuable changes.
+
+## REPOSITORY STRUCTURE
+
+{repo_structure}
+
+
+## RECENT COMMITS (Last 10)
+
+{recent_commits}
+
+{context_block}
+"""
+
+
+def build_improvement_prompt(repository: str, base_branch: str) -> str:
+    """Build a comprehensive improvement prompt for Copilot coding agent.
+
+    This implementation is generally applicable to any repository. It:
+    - Analyzes the repository structure
+    - Reviews recent commits
+    - Reads project-specific context from CONTEXT.md (if present)
+    - Instructs the agent to generate and work on prioritized tasks
+
+    Args:
+        repository: Repository in 'owner/repo' format
+        base_branch: Target branch for improvements
+
+    Returns:
+        Formatted prompt string for Copilot
+    """
+    return _dynamic_prefix(repository, base_branch) + _STATIC_TAIL
+
+
+def build_improvement_prompt_bytes(repository: str, base_branch: str) -> bytes:
+    """Build the improvement prompt as UTF-8 bytes.
+
+    Callers that immediately encode the prompt for transport can use this
+    to avoid re-encoding the invariant tail every cycle; only the dynamic
+    prefix pays for a UTF-8 pass.
+    """
+    return b"".join((
+        _dynamic_prefix(repository, base_branch).encode("utf-8"),
+        _STATIC_TAIL_BYTES,
+    ))
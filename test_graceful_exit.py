@@ -3,8 +3,12 @@
 
 import unittest
 from unittest.mock import Mock, patch, MagicMock
-import time
-from pr_manager import _should_stop_waiting, _interruptible_sleep
+from pr_manager import (
+    _should_stop_waiting,
+    _interruptible_sleep,
+    wait_for_pr_ready,
+    wait_for_pr_checks,
+)
 
 
 class TestGracefulExit(unittest.TestCase):
@@ -29,128 +33,112 @@ class TestGracefulExit(unittest.TestCase):
         self.assertTrue(result)
         shutdown_check.assert_called_once()
     
+    @staticmethod
+    def _fake_clock():
+        """Build a (sleep_fn, clock) pair backed by a virtual timeline."""
+        now = [0.0]
+
+        def sleep_fn(seconds):
+            now[0] += seconds
+
+        def clock():
+            return now[0]
+
+        return sleep_fn, clock
+
     def test_interruptible_sleep_no_shutdown(self):
         """Test _interruptible_sleep completes normally."""
-        start = time.time()
-        result = _interruptible_sleep(2, None)
-        elapsed = time.time() - start
-        
+        sleep_fn, clock = self._fake_clock()
+        result = _interruptible_sleep(2, None, sleep_fn=sleep_fn, clock=clock)
+
         self.assertFalse(result)
-        self.assertGreaterEqual(elapsed, 2.0)
-        self.assertLess(elapsed, 2.5)
-    
+        self.assertEqual(clock(), 2.0)
+
     def test_interruptible_sleep_with_shutdown(self):
         """Test _interruptible_sleep stops early on shutdown."""
         # Return False twice, then True, then continue returning True
         shutdown_check = Mock(side_effect=[False, False, True] + [True] * 10)
-        
-        start = time.time()
-        result = _interruptible_sleep(10, shutdown_check)
-        elapsed = time.time() - start
-        
+
+        sleep_fn, clock = self._fake_clock()
+        result = _interruptible_sleep(10, shutdown_check, sleep_fn=sleep_fn, clock=clock)
+
         self.assertTrue(result)
-        # Should stop after ~3 seconds instead of 10
-        self.assertLess(elapsed, 5.0)
+        # Should stop after ~2 virtual seconds instead of 10
+        self.assertLess(clock(), 10.0)
     
-    @patch('pr_manager.session')
-    def test_wait_for_pr_ready_detects_closed_pr(self, mock_session):
+    @patch('pr_manager.get_pr_state')
+    def test_wait_for_pr_ready_detects_closed_pr(self, mock_pr_state):
         """Test wait_for_pr_ready stops when PR is closed."""
-        # Mock PR response showing closed state
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        # Mock PR state showing closed state
+        mock_pr_state.return_value = {
             "state": "closed",
-            "title": "Test PR"
+            "title": "Test PR",
+            "reviewers": [],
         }
-        mock_response.raise_for_status = Mock()
-        mock_session.get.return_value = mock_response
-        
-        from pr_manager import wait_for_pr_ready
-        
+
         result = wait_for_pr_ready("owner/repo", 123, timeout=60)
-        
+
         self.assertFalse(result)
-    
-    @patch('pr_manager.session')
-    def test_wait_for_pr_ready_with_shutdown_check(self, mock_session):
+
+    @patch('pr_manager.get_pr_state')
+    def test_wait_for_pr_ready_with_shutdown_check(self, mock_pr_state):
         """Test wait_for_pr_ready respects shutdown check."""
-        # Mock PR response showing WIP state
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        # Mock PR state showing WIP state with no reviewers yet
+        mock_pr_state.return_value = {
             "state": "open",
-            "title": "[WIP] Test PR"
+            "title": "[WIP] Test PR",
+            "reviewers": [],
         }
-        mock_response.raise_for_status = Mock()
-        
-        mock_reviewers_response = Mock()
-        mock_reviewers_response.json.return_value = {"users": []}
-        mock_reviewers_response.raise_for_status = Mock()
-        
-        mock_session.get.side_effect = [mock_response, mock_reviewers_response]
-        
+
         # Shutdown immediately
         shutdown_check = Mock(return_value=True)
-        
-        from pr_manager import wait_for_pr_ready
-        
+
         result = wait_for_pr_ready("owner/repo", 123, timeout=60, shutdown_check=shutdown_check)
-        
+
         self.assertFalse(result)
         shutdown_check.assert_called()
     
-    @patch('pr_manager.session')
-    def test_wait_for_pr_checks_detects_closed_pr(self, mock_session):
+    @patch('pr_manager.get_pr_state')
+    def test_wait_for_pr_checks_detects_closed_pr(self, mock_pr_state):
         """Test wait_for_pr_checks stops when PR is closed."""
-        # Mock PR response showing closed state
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        # Mock PR state showing closed state
+        mock_pr_state.return_value = {
             "state": "closed",
-            "mergeable_state": "unknown"
+            "merge_state": "unknown",
+            "check_runs": [],
         }
-        mock_response.raise_for_status = Mock()
-        mock_session.get.return_value = mock_response
-        
-        from pr_manager import wait_for_pr_checks
-        
+
         result = wait_for_pr_checks("owner/repo", 123, timeout=60)
-        
+
         self.assertFalse(result)
-    
-    @patch('pr_manager.session')
-    def test_wait_for_pr_checks_with_shutdown_check(self, mock_session):
+
+    @patch('pr_manager.get_pr_state')
+    def test_wait_for_pr_checks_with_shutdown_check(self, mock_pr_state):
         """Test wait_for_pr_checks respects shutdown check."""
-        # Mock PR response showing blocked state
-        mock_response = Mock()
-        mock_response.json.return_value = {
+        # Mock PR state showing blocked state
+        mock_pr_state.return_value = {
             "state": "open",
-            "mergeable_state": "blocked"
+            "merge_state": "blocked",
+            "check_runs": [],
         }
-        mock_response.raise_for_status = Mock()
-        mock_session.get.return_value = mock_response
-        
+
         # Shutdown immediately
         shutdown_check = Mock(return_value=True)
-        
-        from pr_manager import wait_for_pr_checks
-        
+
         result = wait_for_pr_checks("owner/repo", 123, timeout=60, shutdown_check=shutdown_check)
-        
+
         self.assertFalse(result)
         shutdown_check.assert_called()
     
-    @patch('pr_manager.session')
-    def test_wait_for_pr_ready_detects_404(self, mock_session):
-        """Test wait_for_pr_ready stops when PR returns 404 (deleted)."""
-        # Mock 404 error
-        import requests
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.raise_for_status.side_effect = requests.HTTPError(response=mock_response)
-        mock_session.get.return_value = mock_response
-        
-        from pr_manager import wait_for_pr_ready
-        
+    @patch('pr_manager.get_pr_state')
+    def test_wait_for_pr_ready_detects_missing_pr(self, mock_pr_state):
+        """Test wait_for_pr_ready stops when the PR no longer exists."""
+        # A deleted PR comes back as null from the API
+        mock_pr_state.return_value = None
+
+
         result = wait_for_pr_ready("owner/repo", 123, timeout=60)
-        
+
         self.assertFalse(result)
 
 
@@ -16,14 +16,15 @@ from prompt_builder import (
 class TestPromptBuilder(unittest.TestCase):
     """Test cases for prompt builder functions."""
     
-    @patch('prompt_builder.get_repository_tree')
-    @patch('prompt_builder.get_repository_commits')
+    @patch('prompt_builder.get_repository_overview')
     @patch('prompt_builder.get_repository_file')
-    def test_build_improvement_prompt_basic(self, mock_file, mock_commits, mock_tree):
+    def test_build_improvement_prompt_basic(self, mock_file, mock_overview):
         """Test that build_improvement_prompt generates a valid prompt."""
         # Mock the GitHub API responses
-        mock_tree.return_value = "Repository structure:\n  README.md\n  main.py"
-        mock_commits.return_value = "abc1234 Initial commit\ndef5678 Add feature"
+        mock_overview.return_value = (
+            "Repository structure:\n  README.md\n  main.py",
+            "abc1234 Initial commit\ndef5678 Add feature",
+        )
         mock_file.return_value = None  # No CONTEXT.md
         
         prompt = build_improvement_prompt("owner/repo", "main")
@@ -45,8 +46,7 @@ class TestPromptBuilder(unittest.TestCase):
         self.assertIn("documentation files", prompt.lower())
         
         # Verify GitHub API functions were called with correct parameters
-        mock_tree.assert_called_once_with("owner/repo", "main")
-        mock_commits.assert_called_once_with("owner/repo", "main")
+        mock_overview.assert_called_once_with("owner/repo", "main")
         mock_file.assert_called_once_with("owner/repo", "CONTEXT.md", "main")
     
     def test_read_context_file_exists(self):
@@ -80,14 +80,12 @@ class TestPromptBuilder(unittest.TestCase):
         # Should have some content (even if it's an error message)
         self.assertGreater(len(commits), 0)
     
-    @patch('prompt_builder.get_repository_tree')
-    @patch('prompt_builder.get_repository_commits')
+    @patch('prompt_builder.get_repository_overview')
     @patch('prompt_builder.get_repository_file')
-    def test_prompt_without_context_file(self, mock_file, mock_commits, mock_tree):
+    def test_prompt_without_context_file(self, mock_file, mock_overview):
         """Test prompt generation works without CONTEXT.md."""
         # Mock the GitHub API responses
-        mock_tree.return_value = "Repository structure:\n  README.md"
-        mock_commits.return_value = "abc1234 Initial commit"
+        mock_overview.return_value = ("Repository structure:\n  README.md", "abc1234 Initial commit")
         mock_file.return_value = None  # No CONTEXT.md
         
         prompt = build_improvement_prompt("test/repo", "main")
@@ -96,16 +94,14 @@ class TestPromptBuilder(unittest.TestCase):
         self.assertGreater(len(prompt), 0)
         self.assertIn("No CONTEXT.md file found", prompt)
     
-    @patch('prompt_builder.get_repository_tree')
-    @patch('prompt_builder.get_repository_commits')
+    @patch('prompt_builder.get_repository_overview')
     @patch('prompt_builder.get_repository_file')
-    def test_prompt_with_context_file(self, mock_file, mock_commits, mock_tree):
+    def test_prompt_with_context_file(self, mock_file, mock_overview):
         """Test prompt generation includes CONTEXT.md content."""
         test_content = "# Test Project\n\nThis is a test context."
-        
+
         # Mock the GitHub API responses
-        mock_tree.return_value = "Repository structure:\n  README.md"
-        mock_commits.return_value = "abc1234 Initial commit"
+        mock_overview.return_value = ("Repository structure:\n  README.md", "abc1234 Initial commit")
         mock_file.return_value = test_content  # CONTEXT.md exists
         
         prompt = build_improvement_prompt("test/repo", "main")
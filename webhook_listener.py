@@ -0,0 +1,138 @@
+"""Webhook listener module.
+
+Optional event-driven alternative to PR status polling. When WEBHOOK_URL is
+configured (a publicly reachable URL registered as a repository webhook for
+pull_request, pull_request_review, check_run, and check_suite events), a
+small HTTP server runs in a
+daemon thread and wakes waiters the moment GitHub delivers an event, instead
+of them sleeping through a full poll interval. When WEBHOOK_URL is unset the
+module stays inert and callers fall back to polling.
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+from config import WEBHOOK_URL, WEBHOOK_PORT, WEBHOOK_SECRET
+
+logger = logging.getLogger(__name__)
+
+# PR actions that indicate Copilot made observable progress
+_RELEVANT_PR_ACTIONS = {"ready_for_review", "review_requested", "edited", "closed", "synchronize"}
+
+# One wakeup event per PR number, created on demand
+_pr_events: Dict[int, threading.Event] = {}
+_pr_events_lock = threading.Lock()
+
+_server: Optional[ThreadingHTTPServer] = None
+_server_lock = threading.Lock()
+
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    """Handles webhook deliveries by waking the matching PR waiter."""
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = self.rfile.read(length) or b"{}"
+        except ValueError:
+            self.send_response(400)
+            self.end_headers()
+            return
+
+        # Reject deliveries that don't carry a valid HMAC signature when a
+        # shared secret is configured, so strangers can't wake our waiters
+        if WEBHOOK_SECRET and not _valid_signature(
+            body, self.headers.get("X-Hub-Signature-256", "")
+        ):
+            logger.warning("Webhook delivery rejected: bad or missing signature")
+            self.send_response(401)
+            self.end_headers()
+            return
+
+        try:
+            payload = json.loads(body)
+        except json.JSONDecodeError:
+            self.send_response(400)
+            self.end_headers()
+            return
+
+        event = self.headers.get("X-GitHub-Event", "")
+        action = payload.get("action", "")
+
+        # check_run/check_suite payloads carry the PRs they belong to;
+        # pull_request payloads carry a single PR
+        pr_numbers = []
+        if event in ("check_run", "check_suite"):
+            for pr in (payload.get(event) or {}).get("pull_requests") or []:
+                if pr.get("number"):
+                    pr_numbers.append(pr["number"])
+        elif event == "pull_request_review" or (
+            event == "pull_request" and action in _RELEVANT_PR_ACTIONS
+        ):
+            pr_number = (payload.get("pull_request") or {}).get("number")
+            if pr_number:
+                pr_numbers.append(pr_number)
+
+        for pr_number in pr_numbers:
+            logger.debug(f"Webhook: {event}/{action} for PR #{pr_number}")
+            pr_event(pr_number).set()
+
+        self.send_response(204)
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        # Keep request logging off stdout; the logger handles it
+        logger.debug("Webhook listener: " + format % args)
+
+
+def _valid_signature(body: bytes, signature_header: str) -> bool:
+    """Check a delivery body against the X-Hub-Signature-256 header."""
+    expected = "sha256=" + hmac.new(
+        WEBHOOK_SECRET.encode(), body, hashlib.sha256
+    ).hexdigest()
+    return hmac.compare_digest(expected, signature_header)
+
+
+def pr_event(pr_number: int) -> threading.Event:
+    """Get (or create) the wakeup event for a PR number."""
+    with _pr_events_lock:
+        event = _pr_events.get(pr_number)
+        if event is None:
+            event = _pr_events[pr_number] = threading.Event()
+        return event
+
+
+def maybe_pr_event(pr_number: int) -> Optional[threading.Event]:
+    """Return the wakeup event for a PR if webhook delivery is enabled.
+
+    Starts the listener on first use. Returns None when WEBHOOK_URL is not
+    configured, signalling callers to use plain polling.
+    """
+    if not WEBHOOK_URL:
+        return None
+    if not _ensure_listener():
+        return None
+    return pr_event(pr_number)
+
+
+def _ensure_listener() -> bool:
+    """Start the webhook HTTP server thread once. Returns True if running."""
+    global _server
+    with _server_lock:
+        if _server is not None:
+            return True
+        try:
+            _server = ThreadingHTTPServer(("", WEBHOOK_PORT), _WebhookHandler)
+        except OSError as e:
+            logger.warning(f"Could not start webhook listener on port {WEBHOOK_PORT}: {e}")
+            return False
+        thread = threading.Thread(target=_server.serve_forever, daemon=True,
+                                  name="webhook-listener")
+        thread.start()
+        logger.info(f"Webhook listener running on port {WEBHOOK_PORT} (URL: {WEBHOOK_URL})")
+        return True